@@ -1,17 +1,49 @@
 import sys
 import os
-import pygame
+import threading
 import customtkinter as ctk
 from src.game import RockPaperScissorsGame
 from src.ui import GameUI
+from src.save_load import flush_writes
+
+MIXER_FREQUENCY = 22050  # matches the synthetic sounds
+MIXER_BUFFER = 256       # samples per chunk, ~12 ms at 22050 Hz
+MIXER_CHANNELS = 4       # the click channel plus room for overlapping results
+
+def ensure_assets():
+    # Create necessary directories
+    os.makedirs("assets/images", exist_ok=True)
+    os.makedirs("assets/sounds", exist_ok=True)
+
+def init_pygame_sound():
+    # Initialize pygame for sound (SDL load + device probing can be slow)
+    try:
+        import pygame
+    except ImportError:
+        print("Sound disabled: pygame is not installed")
+        return
+    try:
+        # Short mono 16-bit effects only: a small buffer keeps click latency low
+        pygame.mixer.init(frequency=MIXER_FREQUENCY, size=-16, channels=1, buffer=MIXER_BUFFER)
+        pygame.mixer.set_num_channels(MIXER_CHANNELS)
+    except pygame.error as e:
+        print(f"Sound disabled: {e}")
+
+def background_init():
+    ensure_assets()
+    init_pygame_sound()
+
+def choose_appearance():
+    ctk.set_appearance_mode("dark")  # Modes: "System" (standard), "Dark", "Light"
+    ctk.set_default_color_theme("blue")  # Themes: "blue" (standard), "green", "dark-blue"
 
 def main():
-    # Initialize pygame for sound
-    pygame.mixer.init()
+    # Audio + asset folders are set up off the critical path; the UI
+    # loads its sounds once pygame.mixer.get_init() reports ready
+    threading.Thread(target=background_init, daemon=True).start()
     
     # Set up the application
-    ctk.set_appearance_mode("dark")  # Modes: "System" (standard), "Dark", "Light"
-    ctk.set_default_color_theme("blue")  # Themes: "blue" (standard), "green", "dark-blue"
+    choose_appearance()
     
     # Create the game instance
     game = RockPaperScissorsGame()
@@ -20,9 +52,8 @@ def main():
     app = GameUI(game)
     app.mainloop()
 
+    # Make sure queued history writes reach the disk before exiting
+    flush_writes()
+
 if __name__ == "__main__":
-    # Create necessary directories
-    os.makedirs("assets/images", exist_ok=True)
-    os.makedirs("assets/sounds", exist_ok=True)
-    
     main()
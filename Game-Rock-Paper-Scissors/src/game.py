@@ -2,11 +2,12 @@
 import random
 import json
 import os
+import threading
 from enum import Enum
 from typing import Optional, Tuple, Dict, List
 
 # ← ĐÃ FIX: import đúng vị trí (save_load.py nằm cùng thư mục src)
-from .save_load import save_match
+from .save_load import save_match, write_file_async, sync_writes
 
 class Choice(Enum):
     ROCK = "rock"
@@ -24,34 +25,176 @@ class GameMode(Enum):
     AI_VS_AI = "ai_vs_ai"
     VS_LOCAL_PLAYER = "vs_local_player"
 
+# Bảng kết quả 3x3: index = p1 * 3 + p2 (ROCK=0, PAPER=1, SCISSORS=2)
+# giá trị: 0 = DRAW, 1 = WIN, 2 = LOSE (theo góc nhìn player 1)
+_CHOICES = (Choice.ROCK, Choice.PAPER, Choice.SCISSORS)
+_CHOICE_INDEX = {choice: i for i, choice in enumerate(_CHOICES)}
+_CHOICE_VALUES = tuple(choice.value for choice in _CHOICES)
+_OUTCOME = bytes([0, 2, 1,
+                  1, 0, 2,
+                  2, 1, 0])
+_RESULTS = (GameResult.DRAW, GameResult.WIN, GameResult.LOSE)
+_RESULT_INDEX = {result: i for i, result in enumerate(_RESULTS)}
+
+# Thông báo kết quả dựng sẵn cho 9 cặp lựa chọn, chỉ còn thay tên người thắng
+_DRAW_MSG = "It's a draw!"
+_WIN_MSG = tuple(
+    "{winner} wins! " + f"{p1.value.capitalize()} beats {p2.value}."
+    for p1 in _CHOICES for p2 in _CHOICES
+)
+
+# ────────────────────── BẢN GHI HISTORY GỌN TRONG BỘ NHỚ ──────────────────────
+# Mỗi round là một tuple thay vì dict lồng nhau:
+#   (round, p1, p2, result, p1_score, p2_score, names)
+#     p1/p2: index trong _CHOICES (-1 nếu không có), result: index trong _RESULTS
+#   bản ghi gộp của simulate_ai_vs_ai:
+#   (round, wins, losses, _BATCH, p1_score, p2_score, names, draws)
+# names là tuple (player1_name, player2_name) dùng chung giữa các round.
+# Entry dạng lạ trong file cũ (không có "player1"/"player2") được giữ nguyên dict.
+_BATCH = 3
+_RESULT_CODES = {"draw": 0, "win": 1, "lose": 2, "batch": _BATCH}
+
+def _pack_record(data: Dict, names: Tuple[str, str]) -> Tuple:
+    """Convert a JSON history entry into the compact in-memory tuple"""
+    if "player1" not in data or "player2" not in data:
+        return data
+    p1, p2 = data["player1"], data["player2"]
+    code = _RESULT_CODES[data["result"]]
+    if code == _BATCH:
+        return (data["round"], data["wins"], data["losses"], _BATCH,
+                p1["score"], p2["score"], names, data["draws"])
+    c1, c2 = p1.get("choice"), p2.get("choice")
+    return (data["round"],
+            _CHOICE_VALUES.index(c1) if c1 else -1,
+            _CHOICE_VALUES.index(c2) if c2 else -1,
+            code, p1["score"], p2["score"], names)
+
+def _expand_record(record: Tuple) -> Dict:
+    """Expand a compact history tuple back into the JSON dict format"""
+    if isinstance(record, dict):
+        return record
+    name1, name2 = record[6]
+    if record[3] == _BATCH:
+        wins, losses, draws = record[1], record[2], record[7]
+        return {
+            "round": record[0],
+            "rounds": wins + losses + draws,
+            "player1": {"name": name1, "score": record[4]},
+            "player2": {"name": name2, "score": record[5]},
+            "result": "batch",
+            "wins": wins,
+            "losses": losses,
+            "draws": draws
+        }
+    return {
+        "round": record[0],
+        "player1": {
+            "name": name1,
+            "choice": _CHOICE_VALUES[record[1]] if record[1] >= 0 else None,
+            "score": record[4]
+        },
+        "player2": {
+            "name": name2,
+            "choice": _CHOICE_VALUES[record[2]] if record[2] >= 0 else None,
+            "score": record[5]
+        },
+        "result": _RESULTS[record[3]].value
+    }
+
+def _count_stats(history: List[Tuple]) -> Tuple[int, int, int]:
+    """Return (wins, losses, total) with a single pass over the history"""
+    wins = losses = total = 0
+    for r in history:
+        code = _RESULT_CODES.get(r.get("result"), 0) if isinstance(r, dict) else r[3]
+        if code == _BATCH:  # bản ghi gộp từ simulate_ai_vs_ai
+            wins += r[1]
+            losses += r[2]
+            total += r[1] + r[2] + r[7]
+            continue
+        if code == 1:
+            wins += 1
+        elif code == 2:
+            losses += 1
+        total += 1
+    return wins, losses, total
+
 class RockPaperScissorsGame:
+    __slots__ = (
+        'player1_score', 'player2_score', 'round',
+        '_history', '_history_lock',
+        'game_mode', 'player1_name', 'player2_name',
+        'player1_choice', 'player2_choice',
+        'history_file', 'legacy_history_file',
+        '_wins', '_losses', '_total', '_name_pairs', '_outcome_table',
+    )
+
     def __init__(self):
         self.player1_score = 0
         self.player2_score = 0
         self.round = 1
-        self.history: List[Dict] = []
+        self._history: Optional[List[Tuple]] = None  # nạp lười, xem _ensure_history_loaded
+        self._history_lock = threading.Lock()
         self.game_mode: Optional[GameMode] = None
         self.player1_name = "Player 1"
         self.player2_name = "AI"
         self.player1_choice: Optional[Choice] = None
         self.player2_choice: Optional[Choice] = None
-        self.history_file = "game_history.json"       # file cũ của bạn (giữ nguyên)
-        self.load_history()
+        self.history_file = "game_history.jsonl"      # mỗi round một dòng JSON (append-only)
+        self.legacy_history_file = "game_history.json"  # file cũ dạng list, chỉ đọc để migrate
+        self._wins = 0
+        self._losses = 0
+        self._total = 0
+        self._name_pairs: Dict[Tuple[str, str], Tuple[str, str]] = {}
+        self._outcome_table: Tuple[Tuple[GameResult, str], ...] = ()
+        self._build_outcome_table()
+        # Đọc history ở luồng nền để song song với việc dựng UI
+        threading.Thread(target=self._ensure_history_loaded, daemon=True).start()
+
+    @property
+    def history(self) -> List[Tuple]:
+        return self._ensure_history_loaded()
+
+    @history.setter
+    def history(self, value: List[Tuple]):
+        self._history = value
+
+    def _names(self, player1: str, player2: str) -> Tuple[str, str]:
+        """Return a shared (player1, player2) name pair so records don't repeat strings"""
+        key = (player1, player2)
+        return self._name_pairs.setdefault(key, key)
+
+    def _ensure_history_loaded(self) -> List[Tuple]:
+        """Load the history file (and stats counters) on first use"""
+        if self._history is None:
+            with self._history_lock:
+                if self._history is None:
+                    self.load_history()
+        return self._history
 
     def set_player_names(self, player1: str, player2: str = "AI"):
         self.player1_name = player1 if player1.strip() else "Player 1"
         self.player2_name = player2
+        self._build_outcome_table()
 
     def set_game_mode(self, mode: GameMode):
         self.game_mode = mode
         if mode == GameMode.AI_VS_AI:
             self.player2_name = "AI 2"
+            self._build_outcome_table()
 
-    def get_choices(self) -> List[str]:
-        return [choice.value for choice in Choice]
+    def _build_outcome_table(self):
+        """Precompute (result, message) for the 9 choice pairs with the current names"""
+        winners = (None, self.player1_name, self.player2_name)  # theo mã _OUTCOME
+        self._outcome_table = tuple(
+            (_RESULTS[code], _WIN_MSG[i].format(winner=winners[code]) if code else _DRAW_MSG)
+            for i, code in enumerate(_OUTCOME)
+        )
+
+    def get_choices(self) -> Tuple[str, ...]:
+        return _CHOICE_VALUES
 
     def make_ai_choice(self) -> Choice:
-        return random.choice(list(Choice))
+        return _CHOICES[random.randrange(3)]
 
     def play_round(self, choice1: Optional[Choice] = None, choice2: Optional[Choice] = None) -> Tuple[GameResult, str]:
         if self.game_mode == GameMode.VS_AI:
@@ -67,7 +210,11 @@ class RockPaperScissorsGame:
             else:
                 return GameResult.DRAW, "Waiting for both players"
 
-        result = self.determine_winner()
+        if self.player1_choice and self.player2_choice:
+            result, message = self._outcome_table[
+                _CHOICE_INDEX[self.player1_choice] * 3 + _CHOICE_INDEX[self.player2_choice]]
+        else:
+            result, message = GameResult.DRAW, _DRAW_MSG
         self.update_scores(result)
 
         # ← LƯU CẢ 2 NƠI:
@@ -77,20 +224,46 @@ class RockPaperScissorsGame:
         self._save_to_menu_history(result)
 
         self.round += 1
-        return result, self.get_result_message(result)
+        return result, message
+
+    def simulate_ai_vs_ai(self, n: int) -> Dict:
+        """Play n AI vs AI rounds at once with NumPy and persist only the aggregate"""
+        import numpy as np
+
+        if n <= 0:
+            return {"rounds": 0, "wins": 0, "losses": 0, "draws": 0}
+
+        rng = np.random.default_rng()
+        p1 = rng.integers(0, 3, n, dtype=np.int8)
+        p2 = rng.integers(0, 3, n, dtype=np.int8)
+        outcome_table = np.frombuffer(_OUTCOME, dtype=np.uint8)
+        results = outcome_table[p1 * 3 + p2]
+
+        wins = int((results == 1).sum())
+        losses = int((results == 2).sum())
+        draws = n - wins - losses
+
+        first_round = self.round
+        self.player1_score += wins
+        self.player2_score += losses
+        self.player1_choice = _CHOICES[int(p1[-1])]
+        self.player2_choice = _CHOICES[int(p2[-1])]
+        self.round += n
+
+        record = (first_round, wins, losses, _BATCH, self.player1_score, self.player2_score,
+                  self._names(self.player1_name, self.player2_name), draws)
+        self.history.append(record)
+        self._total += n
+        self._wins += wins
+        self._losses += losses
+        self.append_history(record)
+
+        return {"rounds": n, "wins": wins, "losses": losses, "draws": draws}
 
     def determine_winner(self) -> GameResult:
         if not self.player1_choice or not self.player2_choice:
             return GameResult.DRAW
-        if self.player1_choice == self.player2_choice:
-            return GameResult.DRAW
-
-        win_conditions = {
-            Choice.ROCK: Choice.SCISSORS,
-            Choice.PAPER: Choice.ROCK,
-            Choice.SCISSORS: Choice.PAPER
-        }
-        return GameResult.WIN if win_conditions[self.player1_choice] == self.player2_choice else GameResult.LOSE
+        return _RESULTS[_OUTCOME[_CHOICE_INDEX[self.player1_choice] * 3 + _CHOICE_INDEX[self.player2_choice]]]
 
     def update_scores(self, result: GameResult):
         if result == GameResult.WIN:
@@ -99,45 +272,89 @@ class RockPaperScissorsGame:
             self.player2_score += 1
 
     def get_result_message(self, result: GameResult) -> str:
-        if result == GameResult.DRAW:
-            return "It's a draw!"
+        if result is GameResult.DRAW:
+            return _DRAW_MSG
         winner = self.player1_name if result == GameResult.WIN else self.player2_name
-        return f"{winner} wins! {self.player1_choice.value.capitalize()} beats {self.player2_choice.value}."
+        template = _WIN_MSG[_CHOICE_INDEX[self.player1_choice] * 3 + _CHOICE_INDEX[self.player2_choice]]
+        return template.format(winner=winner)
 
     # ────────────────────── LƯU CHI TIẾT NHƯ CŨ (giữ nguyên) ──────────────────────
     def save_round(self, result: GameResult):
-        round_data = {
-            "round": self.round,
-            "player1": {
-                "name": self.player1_name,
-                "choice": self.player1_choice.value if self.player1_choice else None,
-                "score": self.player1_score
-            },
-            "player2": {
-                "name": self.player2_name,
-                "choice": self.player2_choice.value if self.player2_choice else None,
-                "score": self.player2_score
-            },
-            "result": result.value
-        }
-        self.history.append(round_data)
-        self.save_history()
+        record = (
+            self.round,
+            _CHOICE_INDEX[self.player1_choice] if self.player1_choice else -1,
+            _CHOICE_INDEX[self.player2_choice] if self.player2_choice else -1,
+            _RESULT_INDEX[result],
+            self.player1_score,
+            self.player2_score,
+            self._names(self.player1_name, self.player2_name)
+        )
+        self.history.append(record)
+        self._record_result(result)
+        self.append_history(record)
+
+    def append_history(self, record: Tuple):
+        """Append a single round to the JSON Lines history file (background writer)"""
+        try:
+            line = json.dumps(_expand_record(record), ensure_ascii=False) + "\n"
+            write_file_async(self.history_file, line, append=True)
+        except Exception as e:
+            print(f"Error saving old history: {e}")
+
+    def export_history(self) -> List[Dict]:
+        """Expand the compact in-memory history into the full dict form"""
+        return [_expand_record(record) for record in self.history]
 
     def save_history(self):
+        """Rewrite the whole history file (explicit export only, not per round)"""
         try:
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(self.history, f, indent=2)
+            payload = "".join(json.dumps(round_data, ensure_ascii=False) + "\n" for round_data in self.export_history())
+            write_file_async(self.history_file, payload)
         except Exception as e:
             print(f"Error saving old history: {e}")
 
     def load_history(self):
+        history: List[Tuple] = []
+        migrate = False
         try:
             if os.path.exists(self.history_file):
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    self.history = json.load(f)
+                # Bytes per line: a torn UTF-8 tail only spoils its own line
+                with open(self.history_file, 'rb') as f:
+                    lines = [(n, line) for n, line in enumerate(f, 1) if line.strip()]
+            elif os.path.exists(self.legacy_history_file):
+                # Migrate the old single-array file to JSON Lines once
+                with open(self.legacy_history_file, 'r', encoding='utf-8') as f:
+                    lines = list(enumerate(json.load(f), 1))
+                migrate = True
+            else:
+                lines = []
         except Exception as e:
             print(f"Error loading old history: {e}")
-            self.history = []
+            lines = []
+            migrate = False
+        for n, line in lines:
+            # One bad record (torn last line after a crash, unknown code) is skipped
+            # rather than costing the whole history
+            try:
+                history.append(self._load_record(json.loads(line) if isinstance(line, bytes) else line))
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                print(f"Skipping bad history record {n}: {e}")
+        # The Tk thread reads _history without the lock: publish it only after the
+        # counters match, so no round is counted against a half-built total
+        self._wins, self._losses, self._total = _count_stats(history)
+        self._history = history
+        if migrate:
+            self.save_history()
+
+    def _load_record(self, data: Dict) -> Tuple:
+        """Pack one parsed history entry, sharing its name pair"""
+        if not isinstance(data, dict):
+            raise TypeError(f"expected an object, got {type(data).__name__}")
+        if "player1" in data and "player2" in data:
+            names = self._names(data["player1"]["name"], data["player2"]["name"])
+        else:
+            names = None
+        return _pack_record(data, names)
 
     # ────────────────────── LƯU NGẮN GỌN CHO MENU (mới thêm) ──────────────────────
     def _save_to_menu_history(self, result: GameResult):
@@ -156,18 +373,37 @@ class RockPaperScissorsGame:
         except Exception as e:
             print(f"[MENU HISTORY] Lỗi lưu: {e}")  # không làm crash game
 
+    # ────────────────────── THỐNG KÊ (đếm dồn, không quét history) ──────────────────────
+    def _record_result(self, result: GameResult):
+        self._total += 1
+        if result == GameResult.WIN:
+            self._wins += 1
+        elif result == GameResult.LOSE:
+            self._losses += 1
+
+    def _recount_stats(self):
+        """Rebuild the stats counters with a single pass over the history"""
+        self._wins, self._losses, self._total = _count_stats(self.history)
+
     # ────────────────────── CÁC HÀM KHÁC (giữ nguyên) ──────────────────────
-    def reset_game(self):
+    def reset_game(self, keep_history: bool = True):
         self.player1_score = 0
         self.player2_score = 0
         self.round = 1
         self.player1_choice = None
         self.player2_choice = None
+        sync_writes()
+        if not keep_history:
+            self._ensure_history_loaded()
+            self.history = []
+            self.save_history()
+            self._recount_stats()
 
     def get_stats(self) -> Dict:
-        total = len(self.history)
-        wins = sum(1 for r in self.history if r["result"] == GameResult.WIN.value)
-        losses = sum(1 for r in self.history if r["result"] == GameResult.LOSE.value)
+        self._ensure_history_loaded()
+        total = self._total
+        wins = self._wins
+        losses = self._losses
         draws = total - wins - losses
         return {
             "total_games": total,
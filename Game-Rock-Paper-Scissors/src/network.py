@@ -1,11 +1,63 @@
+import asyncio
+import functools
+import logging
 import socket
+import struct
 import threading
-import json
-import time
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Dict, Any, Callable, Set
 from enum import Enum
 import ipaddress
 
+import msgpack
+
+__all__ = ["NetworkManager", "NetworkMessageType"]
+
+try:
+    # libuv-backed event loop, roughly 2x asyncio's throughput; not available on
+    # Windows, which keeps the default ProactorEventLoop
+    import uvloop
+    _new_event_loop = uvloop.new_event_loop
+except ImportError:
+    _new_event_loop = asyncio.new_event_loop
+
+# Lazy %-style logging: nothing is formatted unless the level is enabled.
+# Without configuration only warnings and errors reach stderr.
+logger = logging.getLogger("rps.net")
+
+# Wire format: 4-byte big-endian length header followed by a MessagePack body
+HEADER = struct.Struct(">I")
+MAX_FRAME = 64 * 1024      # game frames are tiny; bigger headers mean a broken peer
+KEEPALIVE_INTERVAL = 30.0  # ping a silent peer after this long; drop it after two (seconds)
+SHUTDOWN_TIMEOUT = 1.0     # how long disconnect lets receive tasks finish on EOF
+
+class ProtocolError(Exception):
+    """Raised when a peer violates the framing protocol"""
+
+# Game frames are tiny, so Nagle's algorithm would only delay them
+SOCKET_BUFFER_SIZE = 256 * 1024
+TCP_QUICKACK = getattr(socket, "TCP_QUICKACK", None)  # Linux only
+
+def _tune_socket(sock):
+    """Disable Nagle and size the kernel buffers on a connected game socket"""
+    if sock is None:
+        return
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+
+@functools.lru_cache(maxsize=1)
+def _get_local_ip() -> str:
+    """Get the local IP address (probed once per process)"""
+    try:
+        # Create a socket to find the local IP
+        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        s.connect(("8.8.8.8", 80))
+        ip = s.getsockname()[0]
+        s.close()
+        return ip
+    except Exception:
+        return "127.0.0.1"
+
 class NetworkMessageType(Enum):
     CONNECT = "connect"
     DISCONNECT = "disconnect"
@@ -15,190 +67,289 @@ class NetworkMessageType(Enum):
     GAME_RESULT = "game_result"
     CHAT_MESSAGE = "chat_message"
     ERROR = "error"
+    PING = "ping"
+    PONG = "pong"
+
+_TYPE_MAP = {message_type.value: message_type for message_type in NetworkMessageType}
+
+def _choice_body_prefix(choice: str) -> bytes:
+    """MessagePack of {"type": "player_choice", "data": {"choice": choice, "seq": ...}} up to the seq value"""
+    pack = functools.partial(msgpack.packb, use_bin_type=True)
+    return (b"\x82" + pack("type") + pack(NetworkMessageType.PLAYER_CHOICE.value) + pack("data")
+            + b"\x82" + pack("choice") + pack(choice) + pack("seq"))
+
+# PLAYER_CHOICE frames differ only in the choice and the trailing sequence number,
+# so everything before the number is encoded once per choice
+_CHOICE_PREFIXES = {choice: _choice_body_prefix(choice) for choice in ("rock", "paper", "scissors")}
+
+def _control_frame(message_type: NetworkMessageType) -> bytes:
+    """Complete frame of a data-less keepalive message"""
+    body = msgpack.packb({"type": message_type.value, "data": {}}, use_bin_type=True)
+    return HEADER.pack(len(body)) + body
+
+_PING_FRAME = _control_frame(NetworkMessageType.PING)
+_PONG_FRAME = _control_frame(NetworkMessageType.PONG)
+
+def _run_loop(loop: asyncio.AbstractEventLoop):
+    """Network thread body: run the loop until stopped, then close it on this thread"""
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
 
 class NetworkManager:
-    def __init__(self, host: str = "0.0.0.0", port: int = 5555):
+    def __init__(self, host: str = "0.0.0.0", port: int = 5555, single_client: bool = False):
         self.host = host
         self.port = port
-        self.socket: Optional[socket.socket] = None
+        self.single_client = single_client  # server accepts one opponent, refuses the rest
         self.connected = False
         self.room_code: Optional[str] = None
         self.player_id: Optional[str] = None
         self.opponent_name: Optional[str] = None
         self.message_handlers: Dict[NetworkMessageType, Callable[[Dict[str, Any]], None]] = {}
-        self.receive_thread: Optional[threading.Thread] = None
-        self.buffer_size = 4096
-        self.client_socket: Optional[socket.socket] = None
         self.is_server = False
-        self.local_ip = self._get_local_ip()
-    
-    def _get_local_ip(self) -> str:
-        """Get the local IP address"""
-        try:
-            # Create a socket to find the local IP
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))
-            ip = s.getsockname()[0]
-            s.close()
-            return ip
-        except Exception:
-            return "127.0.0.1"
+        self.buffer_size = 4096
+        self._packer = msgpack.Packer(use_bin_type=True)
+        self._envelope: Dict[str, Any] = {"type": None, "data": None}
+        self._pack_lock = threading.Lock()
+        self.local_ip: Optional[str] = None  # resolved when a room is created
+        self._choice_seq = 0  # stamped on every PLAYER_CHOICE so peers can drop replays
+        
+        # Every socket of this manager is driven by one asyncio loop on one thread
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.loop_thread: Optional[threading.Thread] = None
+        self.server: Optional[asyncio.AbstractServer] = None
+        # Connected peers: every client (server side) or the server (client side).
+        # Only ever mutated or iterated on the loop thread, so it needs no lock;
+        # other threads may only test it for emptiness.
+        self.writers: Set[asyncio.StreamWriter] = set()
+        self._readers: Set[asyncio.Task] = set()  # one _receive_frames task per peer (loop thread)
     
     def set_message_handler(self, message_type: NetworkMessageType, handler: Callable[[Dict[str, Any]], None]):
         """Set a handler for a specific message type"""
         self.message_handlers[message_type] = handler
     
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the network event loop thread if it is not running yet"""
+        if self.loop is None or self.loop.is_closed():
+            self.loop = _new_event_loop()
+            self.loop_thread = threading.Thread(target=_run_loop, args=(self.loop,), daemon=True)
+            self.loop_thread.start()
+        return self.loop
+    
+    def _run(self, coro, timeout: Optional[float] = None):
+        """Run a coroutine on the network loop and wait for its result"""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop()).result(timeout)
+    
     def start_server(self, port: int = 5555) -> Optional[str]:
         """Start the game server and return room code"""
         try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            self.socket.bind((self.host, port))
-            self.socket.listen(1)
+            self._run(self._serve(port), timeout=5)
             self.connected = True
             self.is_server = True
             self.port = port
             
-            # Generate room code from IP and port
+            # Generate room code from IP and port; clients never need the probe
+            if self.local_ip is None:
+                self.local_ip = _get_local_ip()
             self.room_code = f"{self.local_ip}:{port}"
             
-            # Start listening for connections in a separate thread
-            self.receive_thread = threading.Thread(target=self._accept_connections, daemon=True)
-            self.receive_thread.start()
-            
-            print(f"Server started on {self.local_ip}:{port}")
+            logger.info("Server started on %s:%s", self.local_ip, port)
             return self.room_code
             
         except Exception as e:
-            print(f"Failed to start server: {e}")
+            logger.error("Failed to start server: %s", e)
+            self._stop_loop()
             return None
     
+    async def _serve(self, port: int):
+        self.server = await asyncio.start_server(
+            self._handle_client, self.host, port, reuse_address=True
+        )
+    
     def connect_to_server(self, host: str, port: int) -> bool:
         """Connect to a game server"""
         try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.connect((host, port))
-            self.connected = True
-            self.is_server = False
-            
-            # Start receiving messages in a separate thread
-            self.receive_thread = threading.Thread(target=self._receive_messages, daemon=True)
-            self.receive_thread.start()
+            self._run(self._connect(host, port), timeout=10)
             
-            print(f"Connected to server at {host}:{port}")
+            logger.info("Connected to server at %s:%s", host, port)
             return True
             
         except Exception as e:
-            print(f"Failed to connect to server: {e}")
+            logger.error("Failed to connect to server: %s", e)
             self.connected = False
+            self._stop_loop()
             return False
     
-    def _accept_connections(self):
-        """Accept incoming connections (server only)"""
-        while self.connected and self.socket:
-            try:
-                client_socket, address = self.socket.accept()
-                print(f"New connection from {address}")
-                self.client_socket = client_socket
-                
-                # Handle client in a separate thread
-                client_thread = threading.Thread(
-                    target=self._handle_client,
-                    args=(client_socket, address),
-                    daemon=True
-                )
-                client_thread.start()
-                
-            except Exception as e:
-                if self.connected:  # Only print if we didn't close the socket intentionally
-                    print(f"Error accepting connection: {e}")
-                break
+    async def _connect(self, host: str, port: int):
+        reader, writer = await asyncio.open_connection(host, port)
+        _tune_socket(writer.get_extra_info("socket"))
+        self.writers.add(writer)
+        # Set before the reader starts, so an immediate close (room full) is reported
+        self.connected = True
+        self.is_server = False
+        # Receive messages from the server as a task on the same loop
+        task = self.loop.create_task(self._receive_frames(reader, writer))
+        self._readers.add(task)
+        task.add_done_callback(self._readers.discard)
     
-    def _handle_client(self, client_socket: socket.socket, address: tuple):
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
         """Handle a connected client (server only)"""
-        buffer = ""
+        address = writer.get_extra_info("peername")
+        if self.single_client and self.writers:
+            logger.info("Refusing connection from %s: room is full", address)
+            writer.close()
+            return
+        logger.info("New connection from %s", address)
+        _tune_socket(writer.get_extra_info("socket"))
+        self.writers.add(writer)
+        task = asyncio.current_task()
+        self._readers.add(task)
+        try:
+            await self._receive_frames(reader, writer)
+        finally:
+            self._readers.discard(task)
+    
+    async def _receive_frames(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Read length-prefixed frames from a peer until it disconnects"""
+        sock = writer.get_extra_info("socket")
+        quickack = TCP_QUICKACK is not None and sock is not None
+        buffer = bytearray()
+        reason = "closed"
+        pinged = False
         try:
-            while self.connected:
-                data = client_socket.recv(self.buffer_size)
+            while True:
+                try:
+                    data = await asyncio.wait_for(reader.read(self.buffer_size), KEEPALIVE_INTERVAL)
+                except asyncio.TimeoutError:
+                    if pinged:
+                        raise  # not even a PONG for a whole interval: the peer is gone
+                    # Quiet is normal between rounds; make the peer prove it is alive
+                    writer.write(_PING_FRAME)
+                    pinged = True
+                    continue
+                pinged = False
                 if not data:
                     break
+                if quickack:
+                    # Ack right away instead of waiting to piggyback on a reply
+                    sock.setsockopt(socket.IPPROTO_TCP, TCP_QUICKACK, 1)
                 
-                # Accumulate data in buffer
-                buffer += data.decode('utf-8')
-                
-                # Process complete messages (separated by newlines)
-                while '\n' in buffer:
-                    message, buffer = buffer.split('\n', 1)
-                    if message.strip():
-                        self._process_message(message, client_socket)
-                    
+                # Accumulate data in buffer, then drop every complete frame at once
+                buffer.extend(data)
+                consumed = self._process_frames(buffer, writer)
+                if consumed:
+                    del buffer[:consumed]
+        except ConnectionError:
+            pass  # peer closed the connection
+        except asyncio.TimeoutError:
+            logger.warning("Closing unresponsive connection %s", writer.get_extra_info("peername"))
+            reason = "timeout"
+        except ProtocolError as e:
+            logger.warning("Closing connection %s: %s", writer.get_extra_info("peername"), e)
+            reason = "protocol_error"
         except Exception as e:
-            print(f"Error handling client {address}: {e}")
+            if self.connected:  # Only print if we didn't close the socket intentionally
+                logger.warning("Error receiving message: %s", e)
+            reason = "error"
         finally:
-            client_socket.close()
+            self.writers.discard(writer)
+            writer.close()
+            if self.connected:
+                # The peer went away on its own; tell the UI instead of leaving it waiting.
+                # A client has lost its only peer; a server once its last one is gone
+                if not self.is_server or not self.writers:
+                    self.connected = False
+                self._process_message({"type": NetworkMessageType.DISCONNECT.value, "data": {"reason": reason}})
     
-    def _receive_messages(self):
-        """Receive messages from the server (client only)"""
-        buffer = ""
-        while self.connected and self.socket:
-            try:
-                data = self.socket.recv(self.buffer_size)
-                if not data:
-                    break
-                
-                # Accumulate data in buffer
-                buffer += data.decode('utf-8')
-                
-                # Process complete messages (separated by newlines)
-                while '\n' in buffer:
-                    message, buffer = buffer.split('\n', 1)
-                    if message.strip():
-                        self._process_message(message)
-                    
-            except Exception as e:
-                if self.connected:  # Only print if we didn't close the socket intentionally
-                    print(f"Error receiving message: {e}")
+    def _process_frames(self, buffer: bytearray, writer: Optional[asyncio.StreamWriter] = None) -> int:
+        """Dispatch every complete frame in buffer (read from writer's peer) and return how many bytes were used"""
+        start = 0
+        available = len(buffer)
+        while available - start >= HEADER.size:
+            (length,) = HEADER.unpack_from(buffer, start)
+            if length > MAX_FRAME:
+                # Never buffer a frame this large; the caller closes the connection
+                raise ProtocolError(f"frame of {length} bytes exceeds {MAX_FRAME}")
+            end = start + HEADER.size + length
+            if end > available:
                 break
+            frame = buffer[start + HEADER.size:end]
+            start = end
+            try:
+                message_data = msgpack.unpackb(frame, raw=False)
+            except (msgpack.UnpackException, ValueError) as e:
+                logger.warning("Invalid message format: %s", e)
+                continue
+            self._process_message(message_data, writer)
+        return start
     
-    def _process_message(self, message: str, client_socket: socket.socket = None):
+    def _process_message(self, message_data: Dict[str, Any], writer: Optional[asyncio.StreamWriter] = None):
         """Process a received message"""
         try:
-            message_data = json.loads(message)
-            message_type = NetworkMessageType(message_data.get("type"))
-            
-            # Call the appropriate handler if registered
-            if message_type in self.message_handlers:
-                self.message_handlers[message_type](message_data)
-                
-        except (json.JSONDecodeError, ValueError) as e:
-            print(f"Invalid message format: {e}")
+            message_type = _TYPE_MAP.get(message_data.get("type"))
+        except (AttributeError, TypeError) as e:
+            logger.warning("Invalid message format: %s", e)
+            return
+        if message_type is None:
+            logger.warning("Invalid message format: unknown type %r", message_data.get("type"))
+            return
+        if message_type is NetworkMessageType.PING:
+            # Answer keepalives here, to the peer that asked; the game never sees them
+            if writer is not None and not writer.is_closing():
+                writer.write(_PONG_FRAME)
+            return
+        
+        # Call the appropriate handler if registered
+        handler = self.message_handlers.get(message_type)
+        if handler is not None:
+            handler(message_data)
     
     def send_message(self, message_type: NetworkMessageType, data: Optional[Dict[str, Any]] = None) -> bool:
         """Send a message to the connected peer"""
-        if not self.connected:
+        if not self.connected or not self.writers:
             return False
             
         try:
-            message = {
-                "type": message_type.value,
-                "timestamp": time.time(),
-                "data": data or {}
-            }
-            
-            serialized = json.dumps(message) + "\n"
-            
-            # Send to appropriate socket
-            target_socket = self.client_socket if self.is_server and self.client_socket else self.socket
-            
-            if target_socket:
-                target_socket.send(serialized.encode('utf-8'))
-                return True
-            return False
+            # Reuse one envelope dict and one Packer instead of allocating per send
+            with self._pack_lock:
+                envelope = self._envelope
+                envelope["type"] = message_type.value
+                envelope["data"] = data or {}
+                body = self._packer.pack(envelope)
+                envelope["data"] = None
+            # Header and body go out as two parts of one gather write, no concatenation
+            return self._send_frame(HEADER.pack(len(body)), body)
                 
         except Exception as e:
-            print(f"Error sending message: {e}")
+            logger.warning("Error sending message: %s", e)
             return False
     
+    def _send_frame(self, *parts: bytes) -> bool:
+        """Hand an already encoded frame (one or more byte parts) to the network loop"""
+        # Writes happen on the network loop; the caller (UI thread) never blocks
+        asyncio.run_coroutine_threadsafe(self._send(parts), self.loop)
+        return True
+    
+    async def _send(self, parts: tuple):
+        """Write one encoded frame to every peer, then drain them together"""
+        live = []
+        for writer in list(self.writers):
+            if writer.is_closing():
+                self.writers.discard(writer)
+                continue
+            # writelines queues the whole frame (no short writes); on Python 3.12+
+            # the selector transport sends the parts with a single sendmsg()
+            writer.writelines(parts)
+            live.append(writer)
+        
+        results = await asyncio.gather(*(writer.drain() for writer in live), return_exceptions=True)
+        for writer, result in zip(live, results):
+            if isinstance(result, Exception):
+                logger.warning("Error sending message: %s", result)
+                self.writers.discard(writer)
+                writer.close()
+    
     def create_room(self) -> Optional[str]:
         """Create a new game room (server)"""
         return self.start_server(self.port)
@@ -209,7 +360,7 @@ class NetworkManager:
             # Parse room code (format: IP:PORT)
             parts = room_code.split(':')
             if len(parts) != 2:
-                print("Invalid room code format. Use: IP:PORT")
+                logger.warning("Invalid room code format. Use: IP:PORT")
                 return False
             
             host = parts[0]
@@ -217,30 +368,70 @@ class NetworkManager:
             
             return self.connect_to_server(host, port)
         except ValueError:
-            print("Invalid room code format")
+            logger.warning("Invalid room code format")
             return False
     
     def send_player_choice(self, choice: str):
-        """Send the player's choice to the opponent"""
-        return self.send_message(NetworkMessageType.PLAYER_CHOICE, {"choice": choice})
+        """Send the player's choice to the opponent, stamped with an increasing seq"""
+        self._choice_seq += 1
+        prefix = _CHOICE_PREFIXES.get(choice)
+        if prefix is not None and self.connected and self.writers:
+            seq = msgpack.packb(self._choice_seq)
+            return self._send_frame(HEADER.pack(len(prefix) + len(seq)), prefix, seq)
+        return self.send_message(NetworkMessageType.PLAYER_CHOICE, {"choice": choice, "seq": self._choice_seq})
     
     def disconnect(self):
         """Disconnect from the current game"""
         if self.connected:
             self.connected = False
+            logger.info("Disconnected")
+        self._stop_loop()
+    
+    def _stop_loop(self):
+        """Shut the sockets down and stop the loop thread, without waiting for it
+        
+        The caller is usually the Tk thread, which the loop thread may be waiting
+        on to deliver an event; joining here could deadlock the two.
+        """
+        loop = self.loop
+        self.loop = None
+        self.loop_thread = None
+        if loop is not None and not loop.is_closed():
             try:
-                if self.socket:
-                    self.socket.close()
-                if self.client_socket:
-                    self.client_socket.close()
-            except:
-                pass
-            print("Disconnected")
+                asyncio.run_coroutine_threadsafe(self._shutdown_and_stop(), loop)
+            except RuntimeError:
+                pass  # the loop closed in between; nothing left to stop
+    
+    async def _shutdown_and_stop(self):
+        try:
+            await self._shutdown()
+        finally:
+            # _run_loop closes the loop once run_forever returns
+            asyncio.get_running_loop().stop()
+    
+    async def _shutdown(self):
+        if self.server is not None:
+            self.server.close()
+        for writer in list(self.writers):
+            writer.close()
+        self.writers.clear()
+        # Closed streams read EOF, so the receive tasks return on their own. Cancelling
+        # them instead made asyncio's connection_made callback log CancelledError
+        readers = list(self._readers)
+        if readers:
+            await asyncio.wait(readers, timeout=SHUTDOWN_TIMEOUT)
+        # Only whatever is still running after that (stuck readers, sends) is cancelled
+        tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
 # Example usage:
 if __name__ == "__main__":
     import time
     
+    logging.basicConfig(level=logging.INFO)
+    
     def handle_choice(message):
         print(f"Opponent choice: {message}")
     
@@ -1,8 +1,24 @@
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional
 from enum import Enum
+import atexit
 import json
 import os
+import sqlite3
+import weakref
+from operator import itemgetter
+
+PLAYERS_DB = "players.db"
+
+# Manager-less players with unsaved stats; weak, so a player dropped by its owner
+# is not kept alive just for the exit flush
+_dirty_players: "weakref.WeakSet" = weakref.WeakSet()
+
+def _flush_dirty_players():
+    for player in list(_dirty_players):
+        player.flush()
+
+atexit.register(_flush_dirty_players)
 
 class PlayerType(Enum):
     HUMAN = "human"
@@ -14,13 +30,14 @@ class PlayerStats:
     wins: int = 0
     losses: int = 0
     draws: int = 0
+    win_rate: float = 0.0  # cached percentage, kept in sync by update_win_rate()
     
-    @property
-    def win_rate(self) -> float:
-        """Calculate the player's win rate as a percentage"""
-        if self.total_games == 0:
-            return 0.0
-        return (self.wins / self.total_games) * 100
+    def __post_init__(self):
+        self.update_win_rate()
+    
+    def update_win_rate(self):
+        """Recalculate the cached win rate as a percentage"""
+        self.win_rate = (self.wins / self.total_games) * 100 if self.total_games else 0.0
     
     def to_dict(self) -> Dict[str, int]:
         """Convert stats to a dictionary"""
@@ -42,13 +59,17 @@ class PlayerStats:
         )
 
 class Player:
-    def __init__(self, name: str, player_type: PlayerType = PlayerType.HUMAN):
+    def __init__(self, name: str, player_type: PlayerType = PlayerType.HUMAN,
+                 manager: Optional['PlayerManager'] = None):
         self.name = name
         self.type = player_type
         self.stats = PlayerStats()
         self.current_choice = None
         self.ready = False
+        self.manager = manager  # shares the manager's SQLite connection; None = JSON file
         self.stats_file = f"player_{name.lower().replace(' ', '_')}_stats.json"
+        self._dirty = False  # stats changed since the last save
+        self._autosave = True  # flush at exit; off for from_dict() snapshots
         
         # Load existing stats if available
         self.load_stats()
@@ -71,25 +92,64 @@ class Player:
             self.stats.losses += 1
         else:  # draw
             self.stats.draws += 1
+        self.stats.update_win_rate()
         
-        # Save stats after each update
-        self.save_stats()
+        # Defer the write; flushed at game end or on exit (the manager flushes its own)
+        self._dirty = True
+        if self.manager is None and self._autosave:
+            _dirty_players.add(self)
+    
+    def flush(self):
+        """Save stats if they changed since the last save"""
+        if self._dirty:
+            self.save_stats()
+    
+    def _row(self) -> tuple:
+        s = self.stats
+        return (self.name, self.type.value, s.total_games, s.wins, s.losses, s.draws)
     
     def save_stats(self):
-        """Save player statistics to a file"""
+        """Save player statistics to the shared database (or the JSON file without a manager)"""
+        if self.manager is None:
+            self.dump_json()
+            return
+        try:
+            with self.manager.db:
+                self.manager.db.execute(
+                    "INSERT OR REPLACE INTO players VALUES(?,?,?,?,?,?)", self._row())
+            self._dirty = False
+        except Exception as e:
+            print(f"Error saving player stats: {e}")
+    
+    def dump_json(self):
+        """Export player statistics to a JSON file (write to a temp file, then rename)"""
+        tmp_file = f"{self.stats_file}.tmp"
         try:
-            with open(self.stats_file, 'w') as f:
-                json.dump(self.stats.to_dict(), f, indent=2)
+            with open(tmp_file, 'w') as f:
+                json.dump(self.stats.to_dict(), f, separators=(',', ':'))
+            os.replace(tmp_file, self.stats_file)
+            self._dirty = False
+            _dirty_players.discard(self)
         except Exception as e:
             print(f"Error saving player stats: {e}")
     
     def load_stats(self):
-        """Load player statistics from a file"""
+        """Load player statistics from the shared database (or the JSON file without a manager)"""
         try:
+            if self.manager is not None:
+                row = self.manager.db.execute(
+                    "SELECT total,wins,losses,draws FROM players WHERE name=?",
+                    (self.name,)).fetchone()
+                if row:
+                    self.stats = PlayerStats(*row)
+                    return
             if os.path.exists(self.stats_file):
                 with open(self.stats_file, 'r') as f:
                     data = json.load(f)
                     self.stats = PlayerStats.from_dict(data)
+                if self.manager is not None:
+                    # Stats from before the database: import the JSON file once
+                    self.save_stats()
         except Exception as e:
             print(f"Error loading player stats: {e}")
     
@@ -120,21 +180,31 @@ class Player:
             name=data["name"],
             player_type=PlayerType(data["type"])
         )
+        player._autosave = False  # a copy (e.g. a network snapshot) must not overwrite the real file
         player.ready = data.get("ready", False)
         player.current_choice = data.get("current_choice")
         player.stats = PlayerStats.from_dict(data.get("stats", {}))
         return player
 
 class PlayerManager:
-    def __init__(self):
+    def __init__(self, db_path: str = PLAYERS_DB):
         self.players: Dict[str, Player] = {}
+        # One SQLite file for every player instead of one JSON file each
+        self.db = sqlite3.connect(db_path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS players("
+            "name TEXT PRIMARY KEY, type TEXT, total INT, wins INT, losses INT, draws INT)")
+        self.db.commit()
+        # Deferred stats must not be lost when the caller never closes us
+        atexit.register(self.close)
     
     def add_player(self, name: str, player_type: PlayerType = PlayerType.HUMAN) -> Player:
         """Add a new player"""
         if name in self.players:
             return self.players[name]
             
-        player = Player(name, player_type)
+        player = Player(name, player_type, manager=self)
         self.players[name] = player
         return player
     
@@ -151,6 +221,30 @@ class PlayerManager:
         """Get all players"""
         return list(self.players.values())
     
+    def flush_all(self):
+        """Save the stats of every player that changed in one transaction"""
+        dirty = [p for p in self.players.values() if p._dirty]
+        if not dirty:
+            return
+        try:
+            with self.db:
+                self.db.executemany(
+                    "INSERT OR REPLACE INTO players VALUES(?,?,?,?,?,?)",
+                    [p._row() for p in dirty])
+            for player in dirty:
+                player._dirty = False
+        except Exception as e:
+            print(f"Error saving player stats: {e}")
+    
+    def close(self):
+        """Flush pending stats and close the database"""
+        if self.db is None:
+            return
+        atexit.unregister(self.close)
+        self.flush_all()
+        self.db.close()
+        self.db = None
+    
     def reset_choices(self):
         """Reset choices for all players"""
         for player in self.players.values():
@@ -178,5 +272,5 @@ class PlayerManager:
                 })
         
         # Sort by win rate (descending), then by number of games (descending)
-        leaderboard.sort(key=lambda x: (-x["win_rate"], -x["total_games"]))
+        leaderboard.sort(key=itemgetter("win_rate", "total_games"), reverse=True)
         return leaderboard
@@ -1,37 +1,197 @@
 # src/save_load.py
+import atexit
 import json
 import os
+import queue
+import threading
+from collections import deque
 from datetime import datetime
 
+try:
+    import orjson  # encoder C nhanh hơn json chuẩn, không bắt buộc
+except ImportError:
+    orjson = None
+
 HISTORY_FILE = "game_history_menu.json"
 MAX_HISTORY = 10
 
-def load_history():
-    if not os.path.exists(HISTORY_FILE):
-        return []
+# ────────────────────── GHI FILE NỀN (không chặn UI) ──────────────────────
+WRITE_QUEUE_SIZE = 256
+COALESCE_SECONDS = 0.05  # gom các lần ghi liên tiếp trong khoảng này
+FSYNC_EVERY = 16         # fsync file append sau mỗi K dòng (mất tối đa K round khi crash)
+APPEND_BUFFER_SIZE = 1 << 14
+
+_SYNC = object()  # marker trong queue: flush + fsync mọi file đang mở
+
+_writer_queue: "queue.Queue" = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+_writer_thread = None
+_writer_lock = threading.Lock()
+_append_files = {}  # path -> [file object, số dòng chưa fsync]; chỉ writer thread dùng
+
+
+def _to_bytes(payload):
+    return payload.encode("utf-8") if isinstance(payload, str) else payload
+
+
+def _sync_file(entry):
+    f = entry[0]
+    f.flush()
+    os.fsync(f.fileno())
+    entry[1] = 0
+
+
+def _close_append_file(path):
+    entry = _append_files.pop(path, None)
+    if entry is not None:
+        entry[0].close()
+
+
+def _sync_all():
+    for path, entry in list(_append_files.items()):
+        try:
+            _sync_file(entry)
+        except Exception as e:
+            print(f"Error syncing {path}: {e}")
+
+
+def _ends_mid_line(path):
+    """True if path exists and its last byte is not a newline"""
     try:
-        with open(HISTORY_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except:
-        return []
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() == 0:
+                return False
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) != b"\n"
+    except FileNotFoundError:
+        return False
+
+
+def _flush_pending(pending):
+    for path, (mode, chunks) in pending.items():
+        data = b"".join(_to_bytes(chunk) for chunk in chunks)
+        try:
+            if mode == "a":
+                entry = _append_files.get(path)
+                if entry is None:
+                    if _ends_mid_line(path):
+                        data = b"\n" + data  # crash left a torn last line; never append onto it
+                    entry = _append_files[path] = [open(path, "ab", buffering=APPEND_BUFFER_SIZE), 0]
+                entry[0].write(data)
+                entry[1] += len(chunks)
+                if entry[1] >= FSYNC_EVERY:
+                    _sync_file(entry)
+            else:
+                _close_append_file(path)
+                # Ghi ra file tạm rồi os.replace để không bao giờ để lại file hỏng
+                tmp_path = f"{path}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+        except Exception as e:
+            print(f"Error writing {path}: {e}")
+
+
+def _writer_loop():
+    while True:
+        items = [_writer_queue.get()]
+        # Drain everything queued within the coalesce window
+        while True:
+            try:
+                items.append(_writer_queue.get(timeout=COALESCE_SECONDS))
+            except queue.Empty:
+                break
+
+        # Chỉ giữ payload mới nhất cho file ghi đè, nối các dòng cho file append
+        pending = {}
+        for item in items:
+            if item is _SYNC:
+                _flush_pending(pending)
+                pending = {}
+                _sync_all()
+                continue
+            path, payload, append = item
+            if append and path in pending:
+                pending[path][1].append(payload)
+            else:
+                pending[path] = ("a" if append else "w", [payload])
+
+        _flush_pending(pending)
+        for _ in items:
+            _writer_queue.task_done()
+
+
+def _ensure_writer():
+    global _writer_thread
+    with _writer_lock:
+        if _writer_thread is None:
+            _writer_thread = threading.Thread(target=_writer_loop, name="history-writer", daemon=True)
+            _writer_thread.start()
+            atexit.register(flush_writes)
+
+
+def write_file_async(path, payload, append=False):
+    """Queue a str/bytes write for the background writer thread"""
+    _ensure_writer()
+    _writer_queue.put((path, payload, append))
+
+
+def sync_writes():
+    """Ask the writer to flush and fsync open append files without waiting"""
+    if _writer_thread is not None:
+        _writer_queue.put(_SYNC)
+
+
+def flush_writes():
+    """Block until every queued write is on disk and fsynced (call on shutdown)"""
+    if _writer_thread is not None:
+        _writer_queue.put(_SYNC)
+        _writer_queue.join()
+
+
+# ────────────────────── LỊCH SỬ NGẮN CHO MENU ──────────────────────
+_history_cache = None  # deque(maxlen=MAX_HISTORY), mới nhất ở đầu
+
+
+def _dumps(data):
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def _ensure_loaded():
+    global _history_cache
+    if _history_cache is None:
+        entries = []
+        if os.path.exists(HISTORY_FILE):
+            try:
+                with open(HISTORY_FILE, "rb") as f:
+                    raw = f.read()
+                entries = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            except:
+                entries = []
+        # The file is newest-first; a bounded deque fed all of it would keep the oldest
+        _history_cache = deque(entries[:MAX_HISTORY], maxlen=MAX_HISTORY)
+    return _history_cache
+
+
+def load_history():
+    return list(_ensure_loaded())
 
 def save_match(player_name, player_choice, opponent_choice, result):
-    history = load_history()
+    history = _ensure_loaded()
     timestamp = datetime.now().strftime("%H:%M")
-    
+
     if result == "win":
         desc = f"{player_name} Win vs AI"
     elif result == "lose":
         desc = f"AI Win vs {player_name}"
     else:
         desc = "Draw"
-    
-    new_entry = {"time": timestamp, "desc": desc}
-    history.insert(0, new_entry)
-    history = history[:MAX_HISTORY]
-    
+
+    history.appendleft({"time": timestamp, "desc": desc})
+
     try:
-        with open(HISTORY_FILE, "w", encoding="utf-8") as f:
-            json.dump(history, f, indent=2, ensure_ascii=False)
+        write_file_async(HISTORY_FILE, _dumps(list(history)))
     except:
-        pass  # không crash nếu lỗi
\ No newline at end of file
+        pass  # không crash nếu lỗi
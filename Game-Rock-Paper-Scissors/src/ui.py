@@ -1,24 +1,95 @@
 import os
+import tkinter as tk
 import customtkinter as ctk
-from PIL import Image, ImageTk
+from PIL import Image
 from typing import Optional, Callable, Dict, Any
-import pygame
-import json
-from enum import Enum
+import pickle
+import queue
+import threading
+import time
+from functools import partial
 from .game import RockPaperScissorsGame, GameMode, Choice, GameResult
 from .network import NetworkManager, NetworkMessageType
 
+_CHOICES = (Choice.ROCK, Choice.PAPER, Choice.SCISSORS)
+_CHOICE_LABELS = ("> ROCK", "> PAPER", "> SCISSORS")
+_CHOICE_FROM_STR = {choice.value: choice for choice in Choice}  # wire string -> Choice
+_CHOICE_UPPER = {choice: choice.value.upper() for choice in Choice}
+OPPONENT_TIMEOUT_MS = 30000
+AI_FIRST_ROUND_MS = 1000
+AI_ROUND_DELAY_MS = 2000  # display time of each AI vs AI result
+SOUND_DEBOUNCE_S = 0.08  # a repeat of the same sound within this window is dropped
+
+# Asset name -> display size; resized RGBA pixels are cached keyed by file mtime+size.
+# PNGs saved at exactly this size are used without any resampling.
+IMAGE_SIZES = {"rock": (120, 120), "paper": (120, 120), "scissors": (120, 120), "logo": (300, 100)}
+IMAGE_CACHE = os.path.join("assets", ".cache", "images.pkl")
+LANCZOS_MIN_RATIO = 4  # smaller downsamples (the usual icon case) use bicubic
+# Generated WAVs for missing sound files, so NumPy is only needed on the first launch
+SOUND_CACHE_DIR = os.path.join("assets", ".cache", "sounds")
+SYNTH_SAMPLE_RATE = 22050
+# Synthetic sound -> (duration s, start Hz, end Hz, amplitude, fade-out s)
+SYNTH_SOUNDS = {
+    "click": (0.1, 800, 800, 0.3, 0.05),  # short beep
+    "win": (0.5, 400, 800, 0.3, 0.0),     # rising tone
+    "lose": (0.5, 600, 200, 0.3, 0.0),    # falling tone
+    "draw": (0.5, 400, 400, 0.2, 0.0),    # neutral tone
+}
+
+def _scan_files(directory: str) -> Dict[str, os.DirEntry]:
+    """List the regular files in a directory with one scandir call"""
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name: entry for entry in it if entry.is_file()}
+    except OSError:
+        return {}
+
 class GameUI(ctk.CTk):
     def __init__(self, game: RockPaperScissorsGame):
         super().__init__()
         
         self.game = game
-        self.images: Dict[str, ctk.CTkImage] = {}
-        self.sounds: Dict[str, pygame.mixer.Sound] = {}
+        # Images are decoded on first use; a missing asset is stored as None
+        self.images: Dict[str, Optional[ctk.CTkImage]] = {}
+        self._image_files: Optional[Dict[str, os.DirEntry]] = None  # assets/images scan
+        self._image_cache: Optional[Dict[str, tuple]] = None  # name -> (source key, pixels)
+        self.sounds: Dict[str, Any] = {}  # name -> pygame.mixer.Sound
+        self._sounds_lock = threading.Lock()  # sounds are filled by a loader thread
+        self._channels: Dict[str, Any] = {}  # sound name -> its reserved mixer channel
+        self._mixer = None  # pygame.mixer, set by the loader thread once it is ready
+        self._sound_played_at: Dict[str, float] = {}  # sound name -> last monotonic start
         self.current_frame = None
+        # Every screen is built once and swapped with tkraise()
+        self._frames: Dict[str, ctk.CTkFrame] = {}
         self.network_manager: Optional[NetworkManager] = None
+        self._network_busy = False  # a room is being created or joined on a worker thread
         self.opponent_choice: Optional[Choice] = None
         self.opponent_ready = False
+        self._awaiting_opponent = False  # our choice is sent, theirs not seen yet
+        self._opponent_timeout_id = None
+        self._last_opponent_seq = 0  # highest PLAYER_CHOICE seq seen from this opponent
+        # The network thread puts (handler, message) here and wakes Tk with one
+        # <<NetworkEvent>> per message; nothing polls while waiting
+        self._network_events: "queue.SimpleQueue" = queue.SimpleQueue()
+        self.bind("<<NetworkEvent>>", self._drain_network_events)
+        # Header labels follow these; a round only rewrites the strings
+        self._names_upper = ("", "")  # (player 1, player 2) names as displayed, set per game
+        self._p1_name_var = tk.StringVar(self)
+        self._p2_name_var = tk.StringVar(self)
+        self._p1_score_var = tk.StringVar(self)
+        self._p2_score_var = tk.StringVar(self)
+        self._round_var = tk.StringVar(self)
+        # Widget changes waiting for the next idle flush (coalesces fast AI rounds)
+        self._pending_ui_update: Dict[str, Any] = {}
+        self._ui_flush_id = None
+        # While the window is minimized updates only pile up; one flush on <Map>
+        self._visible = True
+        self.bind("<Unmap>", self._on_window_unmap)
+        self.bind("<Map>", self._on_window_map)
+        self._ai_round_id = None  # pending AI vs AI round, cancelled when the screen goes
+        # Widgets of the screen on display, by role; emptied when it is torn down
+        self._live_widgets: Dict[str, Any] = {}
+        self._screen_widgets: Dict[str, Dict[str, Any]] = {}  # cached screen name -> its widgets
         
         # Retro color scheme
         self.retro_colors = {
@@ -38,10 +109,22 @@ class GameUI(ctk.CTk):
             "error": "#ff3333"  # Error red
         }
         
-        # Retro font
-        self.retro_font = ("Courier New", 14, "bold")
-        self.retro_font_large = ("Courier New", 24, "bold")
-        self.retro_font_xlarge = ("Courier New", 32, "bold")
+        # Retro font: one shared CTkFont per size, so widgets reuse the same
+        # Tk named font instead of resolving a tuple each time
+        self.retro_font = ctk.CTkFont(family="Courier New", size=14, weight="bold")
+        self.retro_font_large = ctk.CTkFont(family="Courier New", size=24, weight="bold")
+        self.retro_font_xlarge = ctk.CTkFont(family="Courier New", size=32, weight="bold")
+        
+        # Default retro widget options, resolved once; callers override single keys
+        self._button_style = {
+            "font": self.retro_font,
+            "fg_color": self.retro_colors["button"],
+            "hover_color": self.retro_colors["button_hover"],
+            "text_color": "#000000",
+            "border_color": self.retro_colors["border"],
+            "border_width": 2,
+        }
+        self._label_style = {"font": self.retro_font, "text_color": self.retro_colors["text"]}
         
         # Configure window with retro theme
         self.title("Rock Paper Scissors - RETRO")
@@ -49,11 +132,8 @@ class GameUI(ctk.CTk):
         self.minsize(800, 600)
         self.configure(bg=self.retro_colors["bg"])
         
-        # Initialize sounds
-        self.load_sounds()
-        
-        # Load images
-        self.load_images()
+        # Initialize sounds in the background (pygame is imported lazily)
+        self._load_sounds_when_ready()
         
         # Configure grid
         self.grid_columnconfigure(0, weight=1)
@@ -63,80 +143,183 @@ class GameUI(ctk.CTk):
         self.show_main_menu()
     
     def load_images(self):
-        """Load all required images"""
+        """Load all known images now instead of on first use"""
+        for name in IMAGE_SIZES:
+            self.get_image(name)
+    
+    def get_image(self, name: str) -> Optional[ctk.CTkImage]:
+        """Return an asset image, decoding it (or reading the cache) on first use"""
+        if name not in self.images:
+            self.images[name] = self._load_image(name)
+        return self.images[name]
+    
+    def _load_image(self, name: str) -> Optional[ctk.CTkImage]:
         try:
-            # Load choice images
-            for choice in ["rock", "paper", "scissors"]:
-                img_path = os.path.join("assets", "images", f"{choice}.png")
-                if os.path.exists(img_path):
-                    img = Image.open(img_path)
-                    img = img.resize((120, 120), Image.LANCZOS)
-                    self.images[choice] = ctk.CTkImage(light_image=img, size=(120, 120))
+            # One directory scan finds the assets; their mtime+size decide
+            # whether a cached entry is still valid
+            if self._image_files is None:
+                self._image_files = _scan_files(os.path.join("assets", "images"))
+            entry = self._image_files.get(f"{name}.png")
+            if entry is None:
+                return None
+            size = IMAGE_SIZES[name]
+            st = entry.stat()
+            source = (entry.path, st.st_mtime_ns, st.st_size, size)
+            
+            if self._image_cache is None:
+                self._image_cache = self._read_image_cache()
+            cached = self._image_cache.get(name)
+            if cached is not None and cached[0] == source:
+                pixels = cached[1]
+            else:
+                pixels = self._render_image(entry.path, size)
+                self._image_cache[name] = (source, pixels)
+                self._write_image_cache(self._image_cache)
             
-            # Load logo
-            logo_path = os.path.join("assets", "images", "logo.png")
-            if os.path.exists(logo_path):
-                logo_img = Image.open(logo_path)
-                logo_img = logo_img.resize((300, 100), Image.LANCZOS)
-                self.images["logo"] = ctk.CTkImage(light_image=logo_img, size=(300, 100))
-                
+            size, data = pixels
+            img = Image.frombytes("RGBA", size, data)
+            return ctk.CTkImage(light_image=img, size=size)
+        except Exception as e:
+            print(f"Error loading image {name}: {e}")
+            return None
+    
+    def _render_image(self, img_path: str, size: tuple) -> tuple:
+        """Decode and resize one asset, returning (size, raw RGBA bytes)"""
+        # The with-block closes the file and frees the full-size decode on exit;
+        # only the small resized bytes outlive this call
+        with Image.open(img_path) as source:
+            if source.size == size:
+                # Asset already saved at display size: decode only, no filtering
+                resized = source.convert("RGBA")
+            else:
+                # JPEG sources shrink while decoding; a no-op for PNG
+                source.draft(source.mode, (size[0] * 2, size[1] * 2))
+                # reducing_gap runs a cheap integer box reduce() first, so the filter
+                # only sees an image at most 2x the target size
+                with source.convert("RGBA") as rgba:
+                    ratio = max(rgba.width / size[0], rgba.height / size[1])
+                    resample = Image.Resampling.LANCZOS if ratio > LANCZOS_MIN_RATIO else Image.Resampling.BICUBIC
+                    resized = rgba.resize(size, resample, reducing_gap=2.0)
+        with resized:
+            return resized.size, resized.tobytes()
+    
+    def _read_image_cache(self) -> Dict[str, tuple]:
+        """Return the cached {name: (source key, pixels)} entries, or {} if there are none"""
+        try:
+            with open(IMAGE_CACHE, "rb") as f:
+                cached = pickle.load(f)
+            if isinstance(cached, dict) and cached.get("version") == 2:
+                return cached["entries"]
+        except Exception:
+            pass  # missing or unreadable cache: decode the PNGs again
+        return {}
+    
+    def _write_image_cache(self, entries: Dict[str, tuple]):
+        """Store the resized pixels next to the assets for the next launch"""
+        try:
+            os.makedirs(os.path.dirname(IMAGE_CACHE), exist_ok=True)
+            tmp_path = f"{IMAGE_CACHE}.tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump({"version": 2, "entries": entries}, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, IMAGE_CACHE)
         except Exception as e:
-            print(f"Error loading images: {e}")
+            print(f"Error writing image cache: {e}")
     
     def create_synthetic_sound(self, sound_type: str):
         """Create a synthetic sound effect if file doesn't exist"""
+        return self.create_synthetic_sounds([sound_type]).get(sound_type)
+    
+    def create_synthetic_sounds(self, sound_types) -> Dict[str, Any]:
+        """Create several synthetic sounds, generating the uncached ones in one batch"""
+        sounds = {}
+        missing = []
+        for sound_type in sound_types:
+            try:
+                # Generated on an earlier launch
+                sounds[sound_type] = self._mixer.Sound(os.path.join(SOUND_CACHE_DIR, f"{sound_type}.wav"))
+            except Exception:
+                missing.append(sound_type)
+        if not missing:
+            return sounds
+        
+        import io
+        generated = self._synthesize_wavs(missing)
         try:
+            os.makedirs(SOUND_CACHE_DIR, exist_ok=True)
+        except OSError as e:
+            print(f"Error writing sound cache: {e}")
+        for sound_type, data in generated.items():
+            cache_path = os.path.join(SOUND_CACHE_DIR, f"{sound_type}.wav")
+            try:
+                tmp_path = f"{cache_path}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, cache_path)
+            except Exception as e:
+                print(f"Error writing sound cache {sound_type}: {e}")
+            try:
+                sounds[sound_type] = self._mixer.Sound(io.BytesIO(data))
+            except Exception as e:
+                print(f"Error creating synthetic sound {sound_type}: {e}")
+        return sounds
     
-            import wave
+    def _synthesize_wavs(self, sound_types) -> Dict[str, bytes]:
+        """Generate the WAV file bytes of the given synthetic sounds together"""
+        try:
+            # Only imported when a sound actually has to be generated
             import io
+            import wave
+            import numpy as np
             
-            sample_rate = 22050
-            duration = 0.1 if sound_type == "click" else 0.5
-            
-            if sound_type == "click":
-                # Short beep for click
-                frequency = 800
-                t = np.linspace(0, duration, int(sample_rate * duration))
-                wave_data = np.sin(2 * np.pi * frequency * t) * 0.3
-                # Add fade out
-                fade_samples = int(sample_rate * 0.05)
-                wave_data[-fade_samples:] *= np.linspace(1, 0, fade_samples)
-            elif sound_type == "win":
-                # Rising tone for win
-                t = np.linspace(0, duration, int(sample_rate * duration))
-                frequency = np.linspace(400, 800, len(t))
-                wave_data = np.sin(2 * np.pi * frequency * t) * 0.3
-            elif sound_type == "lose":
-                # Falling tone for lose
-                t = np.linspace(0, duration, int(sample_rate * duration))
-                frequency = np.linspace(600, 200, len(t))
-                wave_data = np.sin(2 * np.pi * frequency * t) * 0.3
-            elif sound_type == "draw":
-                # Neutral tone for draw
-                t = np.linspace(0, duration, int(sample_rate * duration))
-                wave_data = np.sin(2 * np.pi * 400 * t) * 0.2
-            else:
-                return None
+            specs = [(name, SYNTH_SOUNDS[name]) for name in sound_types if name in SYNTH_SOUNDS]
+            if not specs:
+                return {}
+            lengths = [int(SYNTH_SAMPLE_RATE * spec[0]) for _, spec in specs]
             
-            # Convert to 16-bit integer
-            wave_data = (wave_data * 32767).astype(np.int16)
+            # One time axis for the longest sound and one float32 buffer for all
+            # samples; each sound is computed in place in its own slice
+            t = np.arange(max(lengths), dtype=np.float32) * np.float32(1 / SYNTH_SAMPLE_RATE)
+            samples = np.empty(sum(lengths), dtype=np.float32)
+            offset = 0
+            for (name, (duration, start_hz, end_hz, amplitude, fade)), n in zip(specs, lengths):
+                wave_data = samples[offset:offset + n]
+                offset += n
+                # Linear chirp from start_hz to end_hz (a constant tone when equal)
+                np.multiply(np.linspace(start_hz, end_hz, n, dtype=np.float32), t[:n], out=wave_data)
+                wave_data *= np.float32(2 * np.pi)
+                np.sin(wave_data, out=wave_data)
+                # Scale straight to the 16-bit range
+                wave_data *= np.float32(amplitude * 32767)
+                if fade:
+                    fade_samples = int(SYNTH_SAMPLE_RATE * fade)
+                    wave_data[-fade_samples:] *= np.linspace(1, 0, fade_samples, dtype=np.float32)
             
-            # Create WAV file in memory
-            wav_buffer = io.BytesIO()
-            with wave.open(wav_buffer, 'wb') as wav_file:
-                wav_file.setnchannels(1)  # Mono
-                wav_file.setsampwidth(2)  # 16-bit
-                wav_file.setframerate(sample_rate)
-                wav_file.writeframes(wave_data.tobytes())
+            # Convert every sound to 16-bit integer with a single cast
+            pcm = samples.astype(np.int16)
             
-            wav_buffer.seek(0)
-            return pygame.mixer.Sound(wav_buffer)
+            wavs = {}
+            offset = 0
+            for (name, _), n in zip(specs, lengths):
+                # Create WAV file in memory
+                wav_buffer = io.BytesIO()
+                with wave.open(wav_buffer, 'wb') as wav_file:
+                    wav_file.setnchannels(1)  # Mono
+                    wav_file.setsampwidth(2)  # 16-bit
+                    wav_file.setframerate(SYNTH_SAMPLE_RATE)
+                    wav_file.writeframes(pcm[offset:offset + n].tobytes())
+                offset += n
+                wavs[name] = wav_buffer.getvalue()
+            return wavs
         except Exception as e:
-            print(f"Error creating synthetic sound {sound_type}: {e}")
-            return None
+            print(f"Error creating synthetic sounds: {e}")
+            return {}
+    
+    def _add_sound(self, sound_name: str, sound):
+        with self._sounds_lock:
+            self.sounds[sound_name] = sound
     
     def load_sounds(self):
-        """Load all required sound effects"""
+        """Load all required sound effects (runs on the sound-loader thread)"""
         try:
             sound_files = {
                 "win": "win.mp3",
@@ -145,118 +328,323 @@ class GameUI(ctk.CTk):
                 "click": "click.mp3"
             }
             
+            # One reserved channel per sound, so playing never searches for a free one
+            if self._mixer.get_num_channels() < len(sound_files):
+                self._mixer.set_num_channels(len(sound_files))
+            self._mixer.set_reserved(len(sound_files))
+            channels = {name: self._mixer.Channel(i) for i, name in enumerate(sound_files)}
+            channels["click"].set_volume(0.7)
+            self._channels = channels
+            
+            present = _scan_files(os.path.join("assets", "sounds"))
+            missing = []
             for sound_name, filename in sound_files.items():
-                sound_path = os.path.join("assets", "sounds", filename)
-                if os.path.exists(sound_path):
+                entry = present.get(filename)
+                if entry is not None:
                     try:
-                        self.sounds[sound_name] = pygame.mixer.Sound(sound_path)
+                        self._add_sound(sound_name, self._mixer.Sound(entry.path))
+                        continue
                     except Exception as e:
                         print(f"Error loading {filename}: {e}")
-                        # Try to create synthetic sound
-                        synthetic = self.create_synthetic_sound(sound_name)
-                        if synthetic:
-                            self.sounds[sound_name] = synthetic
-                else:
-                    # Create synthetic sound if file doesn't exist
-                    synthetic = self.create_synthetic_sound(sound_name)
-                    if synthetic:
-                        self.sounds[sound_name] = synthetic
-                        print(f"Created synthetic sound for {sound_name}")
+                missing.append(sound_name)
+            
+            # Create synthetic sounds for every missing or broken file at once
+            if missing:
+                for sound_name, synthetic in self.create_synthetic_sounds(missing).items():
+                    self._add_sound(sound_name, synthetic)
+                    print(f"Created synthetic sound for {sound_name}")
         except Exception as e:
             print(f"Error loading sounds: {e}")
     
+    def _load_sounds_when_ready(self):
+        """Import pygame and load sounds on a worker thread, off the startup path"""
+        threading.Thread(target=self._sound_loader, name="sound-loader", daemon=True).start()
+    
+    def _sound_loader(self):
+        try:
+            import pygame  # SDL is only loaded here, never at module import
+        except ImportError:
+            return  # no audio; play_sound stays a no-op
+        # pygame.mixer may still be starting in main.background_init; wait a few seconds
+        for _ in range(100):
+            if pygame.mixer.get_init():
+                break
+            time.sleep(0.05)
+        else:
+            return
+        self._mixer = pygame.mixer
+        self.load_sounds()
+    
     def play_sound(self, sound_name: str):
         """Play a sound effect if available"""
-        if sound_name in self.sounds:
-            try:
-                pygame.mixer.Sound.play(self.sounds[sound_name])
-            except:
-                pass
-    
-    def create_retro_label(self, parent, text, font=None, text_color=None, **kwargs):
-        """Create a retro-styled label"""
-        if font is None:
-            font = self.retro_font
-        if text_color is None:
-            text_color = self.retro_colors["text"]
-        return ctk.CTkLabel(
-            parent,
-            text=text,
-            font=font,
-            text_color=text_color,
-            **kwargs
+        if self._mixer is None:
+            return
+        sound = self.sounds.get(sound_name)
+        if sound is not None:
+            # Coalesce bursts (double clicks, queued rounds) into a single playback
+            now = time.monotonic()
+            if now - self._sound_played_at.get(sound_name, float("-inf")) < SOUND_DEBOUNCE_S:
+                return
+            self._sound_played_at[sound_name] = now
+            channel = self._channels.get(sound_name)
+            if channel is not None:
+                channel.play(sound)
+            else:
+                sound.play()
+    
+    def create_retro_label(self, parent, text, **options):
+        """Create a retro-styled label; options override the default style"""
+        return ctk.CTkLabel(parent, text=text, **{**self._label_style, **options})
+    
+    def create_retro_button(self, parent, text, command, **options):
+        """Create a retro-styled button; options override the default style"""
+        return ctk.CTkButton(parent, text=text, command=command, **{**self._button_style, **options})
+    
+    def _click_then(self, action: Callable[..., Any], *args):
+        """Button command: play the click sound, then run action(*args)"""
+        self.play_sound("click")
+        action(*args)
+    
+    def _new_screen_frame(self) -> ctk.CTkFrame:
+        """Create an empty, not yet placed screen frame"""
+        frame = ctk.CTkFrame(
+            self,
+            fg_color=self.retro_colors["frame"],
+            border_color=self.retro_colors["border"],
+            border_width=2
         )
+        frame.grid_columnconfigure(0, weight=1)
+        frame.grid_rowconfigure(0, weight=1)
+        # The frame always fills the window, so children never need to resize it
+        frame.grid_propagate(False)
+        frame.pack_propagate(False)
+        return frame
     
-    def create_retro_button(self, parent, text, command, fg_color=None, hover_color=None, 
-                           text_color="#000000", border_color=None, font=None, **kwargs):
-        """Create a retro-styled button"""
-        if fg_color is None:
-            fg_color = self.retro_colors["button"]
-        if hover_color is None:
-            hover_color = self.retro_colors["button_hover"]
-        if border_color is None:
-            border_color = self.retro_colors["border"]
-        # Respect an explicit font when provided, otherwise use the default retro font
-        if font is None:
-            font = self.retro_font
-
-        # Ensure we don't pass a duplicate 'font' in kwargs
-        if 'font' in kwargs:
-            kwargs.pop('font')
-
-        return ctk.CTkButton(
+    def _place_screen_frame(self, frame: ctk.CTkFrame):
+        """Put a fully built screen frame into the window's single grid cell"""
+        frame.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
+    
+    def _drop_current_frame(self):
+        """Forget the screen on display; it stays built under the others"""
+        self.current_frame = None
+        self._live_widgets = {}
+        self._stop_ai_rounds()
+    
+    def _build_choice_buttons(self, parent, on_choice: Callable[[Choice], None]):
+        """Grid the rock/paper/scissors buttons; on_choice receives the Choice"""
+        choice_colors = (self.retro_colors["button"], self.retro_colors["accent"], self.retro_colors["accent2"])
+        for i, (choice, label, color) in enumerate(zip(_CHOICES, _CHOICE_LABELS, choice_colors)):
+            btn = self.create_retro_button(
+                parent,
+                text=label,
+                command=partial(on_choice, choice),
+                width=120,
+                height=40,
+                fg_color=color
+            )
+            btn.grid(row=0, column=i, padx=10)
+    
+    def _update_score_vars(self, round_number: Optional[int] = None):
+        """Push the current scores and round into the header label variables"""
+        if round_number is None:
+            round_number = self.game.round
+        self._p1_score_var.set(f"SCORE: {self.game.player1_score}")
+        self._p2_score_var.set(f"SCORE: {self.game.player2_score}")
+        self._round_var.set(f">>> ROUND {round_number} <<<")
+    
+    def _update_name_vars(self):
+        """Push the current player names into the header label variables"""
+        # Names don't change mid-match, so round screens reuse these strings
+        self._names_upper = p1, p2 = self.game.player1_name.upper(), self.game.player2_name.upper()
+        self._p1_name_var.set(f"> {p1}")
+        self._p2_name_var.set(f"{p2} <")
+    
+    def _build_score_header(self, parent):
+        """Grid the names, scores and round of the current game straight into one header frame"""
+        header = ctk.CTkFrame(
             parent,
-            text=text,
-            font=font,
-            fg_color=fg_color,
-            hover_color=hover_color,
-            text_color=text_color,
-            border_color=border_color,
-            border_width=2,
-            command=command,
-            **kwargs
+            height=60,
+            fg_color=self.retro_colors["frame"],
+            border_color=self.retro_colors["border"],
+            border_width=2
         )
+        header.grid(row=0, column=0, sticky="ew", pady=(0, 20))
+        header.grid_columnconfigure((0, 1, 2), weight=1)
+        
+        # Player 1 info
+        self.create_retro_label(
+            header,
+            text="",
+            textvariable=self._p1_name_var,
+            font=self.retro_font
+        ).grid(row=0, column=0, sticky="w", padx=20)
+        self.create_retro_label(
+            header,
+            text="",
+            textvariable=self._p1_score_var,
+            text_color=self.retro_colors["text_secondary"]
+        ).grid(row=1, column=0, sticky="w", padx=20)
+        
+        # Round info
+        self.create_retro_label(
+            header,
+            text="",
+            textvariable=self._round_var,
+            font=self.retro_font_large,
+            text_color=self.retro_colors["accent"]
+        ).grid(row=0, column=1, rowspan=2)
+        
+        # Player 2 info
+        self.create_retro_label(
+            header,
+            text="",
+            textvariable=self._p2_name_var,
+            font=self.retro_font
+        ).grid(row=0, column=2, sticky="e", padx=20)
+        self.create_retro_label(
+            header,
+            text="",
+            textvariable=self._p2_score_var,
+            text_color=self.retro_colors["text_secondary"]
+        ).grid(row=1, column=2, sticky="e", padx=20)
     
-    def clear_frame(self):
-        """Clear the current frame"""
-        if self.current_frame:
-            self.current_frame.destroy()
-        self.current_frame = ctk.CTkFrame(
-            self,
+    def _build_game_layout(self, frame) -> ctk.CTkFrame:
+        """Lay out a game screen: score header on top, returned game area below"""
+        # Configure grid
+        frame.grid_columnconfigure(0, weight=1)
+        frame.grid_rowconfigure(1, weight=1)
+        
+        # Header with scores
+        self._build_score_header(frame)
+        
+        # Game area
+        game_area = ctk.CTkFrame(
+            frame,
             fg_color=self.retro_colors["frame"],
             border_color=self.retro_colors["border"],
             border_width=2
         )
-        self.current_frame.grid(row=0, column=0, sticky="nsew", padx=20, pady=20)
-        self.current_frame.grid_columnconfigure(0, weight=1)
-        self.current_frame.grid_rowconfigure(0, weight=1)
+        game_area.grid(row=1, column=0, sticky="nsew")
+        return game_area
+    
+    def _build_choice_area(self, frame, on_choice: Callable[[Choice], None]) -> ctk.CTkFrame:
+        """Lay out a rock/paper/scissors screen and return its empty result frame"""
+        game_area = self._build_game_layout(frame)
+        game_area.grid_columnconfigure((0, 1, 2), weight=1)
+        game_area.grid_rowconfigure(1, weight=1)
+        
+        # Player choices
+        choices_frame = ctk.CTkFrame(game_area, fg_color="transparent")
+        choices_frame.grid(row=0, column=0, columnspan=3, pady=(0, 20))
+        
+        self.create_retro_label(
+            choices_frame,
+            text="> CHOOSE YOUR MOVE:",
+            font=self.retro_font_large
+        ).pack()
+        
+        # Choice buttons
+        buttons_frame = ctk.CTkFrame(choices_frame, fg_color="transparent")
+        buttons_frame.pack(pady=10)
+        
+        self._build_choice_buttons(buttons_frame, on_choice)
+        
+        result_frame = ctk.CTkFrame(game_area, fg_color="transparent")
+        result_frame.grid(row=1, column=0, columnspan=3, sticky="nsew")
+        # The grid cell sizes the frame; packing results must not relayout the screen
+        result_frame.pack_propagate(False)
+        return result_frame
+    
+    def _queue_ui_update(self, **changes):
+        """Stash score/result changes and apply them together on the next idle tick"""
+        self._pending_ui_update.update(changes)
+        if self._ui_flush_id is None and self._visible:
+            self._ui_flush_id = self.after_idle(self._flush_ui_updates)
+    
+    def _on_window_unmap(self, event):
+        # Children also carry the window in their bindtags; only react to the window itself
+        if event.widget is self:
+            self._visible = False
+    
+    def _on_window_map(self, event):
+        if event.widget is self:
+            self._visible = True
+            if self._pending_ui_update:
+                self._queue_ui_update()  # catch up with the latest state in one flush
+    
+    def _flush_ui_updates(self):
+        """Apply pending updates: all configure() writes first, then one layout pass"""
+        pending, self._pending_ui_update = self._pending_ui_update, {}
+        self._ui_flush_id = None
+        widgets = self._live_widgets
+        result_label = widgets.get("result")
+        choices_label = widgets.get("choices")
+        # Updates for a screen the user already left have nothing to touch
+        message = pending.get("message") if result_label else None
+        choices = pending.get("choices") if choices_label else None
+        
+        # Writes
+        if pending.get("scores"):
+            self._update_score_vars()
+        if message is not None:
+            result_label.configure(text=f">>> {message.upper()} <<<")
+        if choices is not None:
+            choices_label.configure(text=f"> {choices}")
+        
+        # Layout
+        if choices is not None:
+            # Online: hide the status line, then show choices, result, next button
+            for widget in widgets["result_frame"].winfo_children():
+                widget.pack_forget()
+            choices_label.pack(pady=10)
+            result_label.pack(pady=10)
+            widgets["next_round"].pack(pady=10)
+        elif message is not None:
+            result_label.pack(pady=20)
+    
+    def _show_screen(self, name: str, build: Callable[[ctk.CTkFrame], Optional[Dict[str, Any]]]):
+        """Raise a cached screen, building it on first use
+        
+        build may return the screen's widgets by role; they become _live_widgets
+        whenever the screen is on display.
+        """
+        self._drop_current_frame()
+        frame = self._frames.get(name)
+        if frame is None:
+            frame = self._new_screen_frame()
+            self._screen_widgets[name] = build(frame) or {}
+            self._place_screen_frame(frame)
+            self._frames[name] = frame
+        frame.tkraise()
+        self.current_frame = frame
+        self._live_widgets = self._screen_widgets[name]
     
     def show_main_menu(self):
         """Show the main menu"""
-        self.clear_frame()
-        
+        self._show_screen("main_menu", self._build_main_menu)
+    
+    def _build_main_menu(self, frame):
+        """Build the main menu widgets (once)"""
         # Add logo if available
-        if "logo" in self.images:
-            logo_label = ctk.CTkLabel(self.current_frame, image=self.images["logo"], text="")
+        logo = self.get_image("logo")
+        if logo is not None:
+            logo_label = ctk.CTkLabel(frame, image=logo, text="")
             logo_label.pack(pady=(0, 40))
         else:
-            title = ctk.CTkLabel(
-                self.current_frame,
+            title = self.create_retro_label(
+                frame,
                 text=">>> ROCK PAPER SCISSORS <<<",
-                font=self.retro_font_xlarge,
-                text_color=self.retro_colors["text"]
+                font=self.retro_font_xlarge
             )
             title.pack(pady=(0, 40))
         
         # Player name entry
-        name_frame = ctk.CTkFrame(self.current_frame, fg_color="transparent")
+        name_frame = ctk.CTkFrame(frame, fg_color="transparent")
         name_frame.pack(pady=(0, 20))
         
-        ctk.CTkLabel(
+        self.create_retro_label(
             name_frame,
-            text="> YOUR NAME:",
-            font=self.retro_font,
-            text_color=self.retro_colors["text"]
+            text="> YOUR NAME:"
         ).pack(side="left", padx=(0, 10))
         self.player_name = ctk.CTkEntry(
             name_frame,
@@ -270,93 +658,79 @@ class GameUI(ctk.CTk):
         self.player_name.pack(side="left")
         
         # Game mode buttons
-        button_frame = ctk.CTkFrame(self.current_frame, fg_color="transparent")
+        button_frame = ctk.CTkFrame(frame, fg_color="transparent")
         button_frame.pack(expand=True, fill="both", pady=20)
         
-        vs_ai_btn = ctk.CTkButton(
+        vs_ai_btn = self.create_retro_button(
             button_frame,
             text="> PLAY VS AI",
+            command=partial(self.start_game, GameMode.VS_AI),
             font=self.retro_font_large,
-            height=50,
-            fg_color=self.retro_colors["button"],
-            hover_color=self.retro_colors["button_hover"],
-            text_color="#000000",
-            border_color=self.retro_colors["border"],
-            border_width=2,
-            command=lambda: self.start_game(GameMode.VS_AI)
+            height=50
         )
         vs_ai_btn.pack(fill="x", pady=10, padx=100)
         
-        vs_local_btn = ctk.CTkButton(
+        vs_local_btn = self.create_retro_button(
             button_frame,
             text="> PLAY LOCAL (2 PLAYERS)",
-            font=self.retro_font_large, 
-            height=50,
-            fg_color=self.retro_colors["button"],
-            hover_color=self.retro_colors["button_hover"],
-            text_color="#000000",
-            border_color=self.retro_colors["border"],
-            border_width=2,
-            command=lambda: [self.play_sound("click"), self.show_local_2player_menu()]
+            command=partial(self._click_then, self.show_local_2player_menu),
+            font=self.retro_font_large,
+            height=50
         )
         vs_local_btn.pack(fill="x", pady=10, padx=100)
         
-        vs_player_btn = ctk.CTkButton(
+        vs_player_btn = self.create_retro_button(
             button_frame,
             text="> PLAY ONLINE",
+            command=partial(self._click_then, self.show_online_menu),
             font=self.retro_font_large,
             height=50,
             fg_color=self.retro_colors["accent"],
             hover_color="#ff8800",
-            text_color="#000000",
-            border_color=self.retro_colors["accent"],
-            border_width=2,
-            command=lambda: [self.play_sound("click"), self.show_online_menu()]
+            border_color=self.retro_colors["accent"]
         )
         vs_player_btn.pack(fill="x", pady=10, padx=100)
         
-        ai_vs_ai_btn = ctk.CTkButton(
+        ai_vs_ai_btn = self.create_retro_button(
             button_frame,
             text="> WATCH AI VS AI",
+            command=partial(self.start_game, GameMode.AI_VS_AI),
             font=self.retro_font_large,
             height=50,
             fg_color=self.retro_colors["accent2"],
             hover_color="#00cccc",
-            text_color="#000000",
-            border_color=self.retro_colors["accent2"],
-            border_width=2,
-            command=lambda: self.start_game(GameMode.AI_VS_AI)
+            border_color=self.retro_colors["accent2"]
         )
         ai_vs_ai_btn.pack(fill="x", pady=10, padx=100)
         
         # Exit button
-        exit_btn = ctk.CTkButton(
+        exit_btn = self.create_retro_button(
             button_frame,
             text="> EXIT",
-            font=self.retro_font,
+            command=partial(self._click_then, self.quit),
+            height=40,
             fg_color=self.retro_colors["button_danger"],
             hover_color=self.retro_colors["button_danger_hover"],
-            height=40,
             text_color="#FFFFFF",
-            border_color=self.retro_colors["button_danger"],
-            border_width=2,
-            command=lambda: [self.play_sound("click"), self.quit()]
+            border_color=self.retro_colors["button_danger"]
         )
         exit_btn.pack(fill="x", pady=(20, 0), padx=100)
     
     def show_local_2player_menu(self):
         """Show the local 2-player setup menu"""
-        self.clear_frame()
-        
+        self._show_screen("local_2player_menu", self._build_local_2player_menu)
+    
+    def _build_local_2player_menu(self, frame):
+        """Build the local 2-player setup widgets (once)"""
         title = self.create_retro_label(
-            self.current_frame,
+            frame,
             text=">>> LOCAL 2-PLAYER GAME <<<",
             font=self.retro_font_xlarge
         )
         title.pack(pady=(0, 30))
         
         # Player 1 name
-        player1_frame = ctk.CTkFrame(self.current_frame, fg_color="transparent")
+        player1_frame = ctk.CTkFrame(frame, fg_color="transparent")
         player1_frame.pack(fill="x", pady=10, padx=100)
         
         self.create_retro_label(player1_frame, text="> PLAYER 1 NAME:",).pack(side="left", padx=(0, 10))
@@ -372,7 +746,7 @@ class GameUI(ctk.CTk):
         self.player1_local_name.pack(side="left")
         
         # Player 2 name
-        player2_frame = ctk.CTkFrame(self.current_frame, fg_color="transparent")
+        player2_frame = ctk.CTkFrame(frame, fg_color="transparent")
         player2_frame.pack(fill="x", pady=10, padx=100)
         
         self.create_retro_label(player2_frame, text="> PLAYER 2 NAME:",).pack(side="left", padx=(0, 10))
@@ -389,7 +763,7 @@ class GameUI(ctk.CTk):
         
         # Start button
         start_btn = self.create_retro_button(
-            self.current_frame,
+            frame,
             text="> START GAME",
             command=self.start_local_2player_game,
             font=self.retro_font_large,
@@ -399,9 +773,9 @@ class GameUI(ctk.CTk):
         
         # Back button
         back_btn = self.create_retro_button(
-            self.current_frame,
+            frame,
             text="> BACK TO MAIN MENU",
-            command=lambda: [self.play_sound("click"), self.show_main_menu()],
+            command=partial(self._click_then, self.show_main_menu),
             height=40
         )
         back_btn.pack(pady=(10, 0))
@@ -416,10 +790,12 @@ class GameUI(ctk.CTk):
 
     def show_online_menu(self):
         """Show the online game menu"""
-        self.clear_frame()
-        
+        self._show_screen("online_menu", self._build_online_menu)
+    
+    def _build_online_menu(self, frame):
+        """Build the online menu widgets (once)"""
         title = self.create_retro_label(
-            self.current_frame,
+            frame,
             text=">>> ONLINE GAME <<<",
             font=self.retro_font_xlarge
         )
@@ -427,7 +803,7 @@ class GameUI(ctk.CTk):
         
         # Create room button
         create_btn = self.create_retro_button(
-            self.current_frame,
+            frame,
             text="> CREATE ROOM",
             command=self.create_room,
             font=self.retro_font_large,
@@ -437,7 +813,7 @@ class GameUI(ctk.CTk):
         create_btn.pack(fill="x", pady=10, padx=100)
         
         # Join room section
-        join_frame = ctk.CTkFrame(self.current_frame, fg_color="transparent")
+        join_frame = ctk.CTkFrame(frame, fg_color="transparent")
         join_frame.pack(fill="x", pady=20, padx=100)
         
         self.room_code = ctk.CTkEntry(
@@ -460,26 +836,73 @@ class GameUI(ctk.CTk):
         
         # Back button
         back_btn = self.create_retro_button(
-            self.current_frame,
+            frame,
             text="> BACK TO MAIN MENU",
-            command=lambda: [self.play_sound("click"), self.show_main_menu()],
+            command=partial(self._click_then, self.show_main_menu),
             height=40
         )
         back_btn.pack(pady=(30, 0))
+        
+        # Progress of create/join while the network works in the background
+        status = self.create_retro_label(
+            frame,
+            text="",
+            text_color=self.retro_colors["text_secondary"]
+        )
+        status.pack(pady=(20, 0))
+        return {"status": status}
+    
+    def _run_network_task(self, task: Callable[[], Any], on_done: Callable[[Any], None]):
+        """Run a blocking network call on a worker thread, then on_done(result) on the Tk thread"""
+        def worker():
+            try:
+                result = task()
+            except Exception as e:
+                print(f"Network error: {e}")
+                result = None
+            self.after(0, on_done, result)
+        
+        self._network_busy = True
+        threading.Thread(target=worker, name="net-connect", daemon=True).start()
+    
+    def _set_online_status(self, text: str):
+        """Show create/join progress on the online menu"""
+        status = self._screen_widgets.get("online_menu", {}).get("status")
+        if status is not None:
+            status.configure(text=text)
     
     def create_room(self):
         """Create a new online game room"""
+        if self._network_busy:
+            return
+        
         # Initialize network manager
-        self.network_manager = NetworkManager()
+        self.network_manager = NetworkManager(single_client=True)
+        
+        self._last_opponent_seq = 0
         
         # Set up message handlers
         self.network_manager.set_message_handler(
             NetworkMessageType.PLAYER_CHOICE,
-            self._handle_opponent_choice
+            partial(self._post_network_event, self._handle_opponent_choice)
+        )
+        self.network_manager.set_message_handler(
+            NetworkMessageType.DISCONNECT,
+            partial(self._post_network_event, self._handle_opponent_disconnect)
         )
         
-        # Start server
-        room_code = self.network_manager.create_room()
+        # Start server off the Tk thread; the menu stays responsive meanwhile
+        self._set_online_status("> CREATING ROOM...")
+        manager = self.network_manager
+        self._run_network_task(manager.create_room, partial(self._on_room_created, manager))
+    
+    def _on_room_created(self, manager: NetworkManager, room_code: Optional[str]):
+        self._network_busy = False
+        self._set_online_status("")
+        if manager is not self.network_manager or self.current_frame is not self._frames.get("online_menu"):
+            # The user moved on while the server was starting
+            manager.disconnect()
+            return
         if room_code:
             self.game.set_game_mode(GameMode.VS_PLAYER)
             self.game.set_player_names(
@@ -492,6 +915,8 @@ class GameUI(ctk.CTk):
     
     def join_room(self):
         """Join an existing game room"""
+        if self._network_busy:
+            return
         room_code = self.room_code.get().strip()
         if not room_code:
             self._show_error("Please enter a room code")
@@ -502,14 +927,31 @@ class GameUI(ctk.CTk):
         # Initialize network manager
         self.network_manager = NetworkManager()
         
+        self._last_opponent_seq = 0
+        
         # Set up message handlers
         self.network_manager.set_message_handler(
             NetworkMessageType.PLAYER_CHOICE,
-            self._handle_opponent_choice
+            partial(self._post_network_event, self._handle_opponent_choice)
+        )
+        self.network_manager.set_message_handler(
+            NetworkMessageType.DISCONNECT,
+            partial(self._post_network_event, self._handle_opponent_disconnect)
         )
         
-        # Try to join
-        if self.network_manager.join_room(room_code):
+        # Try to join off the Tk thread; connecting can take up to its timeout
+        self._set_online_status("> CONNECTING...")
+        manager = self.network_manager
+        self._run_network_task(partial(manager.join_room, room_code), partial(self._on_room_joined, manager))
+    
+    def _on_room_joined(self, manager: NetworkManager, joined: Optional[bool]):
+        self._network_busy = False
+        self._set_online_status("")
+        if manager is not self.network_manager or self.current_frame is not self._frames.get("online_menu"):
+            # The user moved on while we were connecting
+            manager.disconnect()
+            return
+        if joined:
             self.game.set_game_mode(GameMode.VS_PLAYER)
             self.game.set_player_names(
                 self.player_name.get() or "Player 2",
@@ -519,16 +961,59 @@ class GameUI(ctk.CTk):
         else:
             self._show_error("Failed to connect to room. Check the room code and try again.")
     
+    def _post_network_event(self, handler: Callable[[Dict[str, Any]], None], message: Dict[str, Any]):
+        """Network thread: queue message for handler and wake the Tk thread"""
+        self._network_events.put((handler, message))
+        try:
+            # Safe from the loop thread: the Tk thread never blocks on that thread
+            # (NetworkManager.disconnect() returns without joining it)
+            self.event_generate("<<NetworkEvent>>", when="tail")
+        except (RuntimeError, tk.TclError):
+            pass  # window already closed; nobody is left to tell
+    
+    def _stop_network_events(self):
+        """Drop events a closed connection left behind"""
+        self._network_events = queue.SimpleQueue()
+    
+    def _drain_network_events(self, event=None):
+        """Run the handlers of every queued network event (Tk thread)"""
+        events = self._network_events
+        while self._network_events is events:  # a handler may end the game mid-drain
+            try:
+                handler, message = events.get_nowait()
+            except queue.Empty:
+                break
+            handler(message)
+    
     def _handle_opponent_choice(self, message: Dict[str, Any]):
-        """Handle opponent's choice received over network"""
+        """Handle opponent's choice received over network (Tk thread)"""
         try:
-            choice_str = message.get("data", {}).get("choice")
-            if choice_str:
-                self.opponent_choice = Choice(choice_str)
+            # Direct indexing: no default dict is allocated for malformed messages
+            data = message["data"]
+            choice = _CHOICE_FROM_STR.get(data["choice"])
+            seq = data.get("seq")
+            if seq is not None:
+                if seq <= self._last_opponent_seq:
+                    return  # duplicate or replayed choice; this round already has it
+                self._last_opponent_seq = seq
+            if choice is not None:
+                self.opponent_choice = choice
                 self.opponent_ready = True
+                self._on_opponent_ready()
+        except (KeyError, TypeError):
+            return  # not a choice message we understand
         except Exception as e:
             print(f"Error handling opponent choice: {e}")
     
+    def _handle_opponent_disconnect(self, message: Dict[str, Any]):
+        """Leave the online game when the connection drops (Tk thread)"""
+        self._end_online_game()
+        if message.get("data", {}).get("reason") == "timeout":
+            self._show_error("Opponent stopped responding. Connection lost.")
+        else:
+            self._show_error("Opponent disconnected.")
+        self.show_main_menu()
+    
     def _show_error(self, error_message: str):
         """Show error dialog"""
         dialog = ctk.CTkToplevel(self)
@@ -547,7 +1032,7 @@ class GameUI(ctk.CTk):
         btn = self.create_retro_button(
             dialog,
             text="> OK",
-            command=lambda: [self.play_sound("click"), dialog.destroy()],
+            command=partial(self._click_then, dialog.destroy),
             fg_color=self.retro_colors["button_danger"],
             text_color="#FFFFFF"
         )
@@ -555,276 +1040,90 @@ class GameUI(ctk.CTk):
     
     def show_local_2player_game_screen(self):
         """Show the local 2-player game screen with alternating player inputs"""
-        self.clear_frame()
-        
-        # Configure grid
-        self.current_frame.grid_columnconfigure(0, weight=1)
-        self.current_frame.grid_rowconfigure(1, weight=1)
-        
-        # Header with scores
-        header = ctk.CTkFrame(
-            self.current_frame,
-            height=60,
-            fg_color=self.retro_colors["frame"],
-            border_color=self.retro_colors["border"],
-            border_width=2
-        )
-        header.grid(row=0, column=0, sticky="ew", pady=(0, 20))
-        header.grid_columnconfigure((0, 1, 2), weight=1)
-        
-        # Player 1 info
-        player1_frame = ctk.CTkFrame(header, fg_color="transparent")
-        player1_frame.grid(row=0, column=0, sticky="w", padx=20)
-        
-        self.create_retro_label(
-            player1_frame,
-            text=f"> {self.game.player1_name.upper()}",
-            font=self.retro_font
-        ).pack()
-        
-        self.player1_score_label = self.create_retro_label(
-            player1_frame,
-            text=f"SCORE: {self.game.player1_score}",
-            text_color=self.retro_colors["text_secondary"]
-        )
-        self.player1_score_label.pack()
-        
-        # Round info
-        round_frame = ctk.CTkFrame(header, fg_color="transparent")
-        round_frame.grid(row=0, column=1)
-        
-        self.round_label = self.create_retro_label(
-            round_frame,
-            text=f">>> ROUND {self.game.round} <<<",
-            font=self.retro_font_large,
-            text_color=self.retro_colors["accent"]
-        )
-        self.round_label.pack()
-        
-        # Player 2 info
-        player2_frame = ctk.CTkFrame(header, fg_color="transparent")
-        player2_frame.grid(row=0, column=2, sticky="e", padx=20)
-        
-        self.create_retro_label(
-            player2_frame,
-            text=f"{self.game.player2_name.upper()} <",
-            font=self.retro_font
-        ).pack()
-        
-        self.player2_score_label = self.create_retro_label(
-            player2_frame,
-            text=f"SCORE: {self.game.player2_score}",
-            text_color=self.retro_colors["text_secondary"]
-        )
-        self.player2_score_label.pack()
-        
-        # Game area
-        game_area = ctk.CTkFrame(
-            self.current_frame,
-            fg_color=self.retro_colors["frame"],
-            border_color=self.retro_colors["border"],
-            border_width=2
-        )
-        game_area.grid(row=1, column=0, sticky="nsew")
-        game_area.grid_columnconfigure((0, 1, 2), weight=1)
-        game_area.grid_rowconfigure(1, weight=1)
-        
-        # Initialize local 2-player state
-        self.local_player1_choice = None
-        self.local_player2_choice = None
-        
-        # Show Player 1's input screen
-        self.show_local_player_input(1, game_area)
+        self._show_screen("local_game", self._build_local_2player_game_screen)
+        self._update_name_vars()
+        self.start_local_2player_round()
     
-    def show_local_player_input(self, player_num: int, game_area):
-        """Show input screen for a local player"""
-        # Clear the game area
-        for widget in game_area.winfo_children():
-            widget.destroy()
-        
-        player_name = self.game.player1_name if player_num == 1 else self.game.player2_name
-        
-        # Title
-        title = self.create_retro_label(
-            game_area,
-            text=f">>> {player_name.upper()}'S TURN <<<",
+    def _build_local_2player_game_screen(self, frame) -> Dict[str, Any]:
+        """Build the local 2-player screen once: header plus the input, hand-over and result views"""
+        # Game area: the three views of a round share its cell and are swapped
+        # with grid_remove()/grid(); a round only reconfigures their texts
+        game_area = self._build_game_layout(frame)
+        game_area.grid_columnconfigure(0, weight=1)
+        game_area.grid_rowconfigure(0, weight=1)
+        
+        widgets: Dict[str, Any] = {}
+        for name in ("input", "waiting", "result"):
+            view = ctk.CTkFrame(game_area, fg_color="transparent")
+            view.grid(row=0, column=0, sticky="nsew")
+            view.grid_columnconfigure((0, 1, 2), weight=1)
+            view.grid_remove()
+            widgets[f"{name}_view"] = view
+        
+        # Input view: title changes with the player on turn
+        view = widgets["input_view"]
+        widgets["turn_title"] = self.create_retro_label(
+            view,
+            text="",
             font=self.retro_font_xlarge,
             text_color=self.retro_colors["accent"]
         )
-        title.grid(row=0, column=0, columnspan=3, pady=(20, 10))
+        widgets["turn_title"].grid(row=0, column=0, columnspan=3, pady=(20, 10))
         
-        # Instruction
-        instruction = self.create_retro_label(
-            game_area,
+        self.create_retro_label(
+            view,
             text="> CHOOSE YOUR MOVE:",
             font=self.retro_font_large
-        )
-        instruction.grid(row=1, column=0, columnspan=3, pady=(0, 20))
+        ).grid(row=1, column=0, columnspan=3, pady=(0, 20))
         
         # Choice buttons
-        buttons_frame = ctk.CTkFrame(game_area, fg_color="transparent")
+        buttons_frame = ctk.CTkFrame(view, fg_color="transparent")
         buttons_frame.grid(row=2, column=0, columnspan=3, pady=20)
         
-        choice_colors = [self.retro_colors["button"], self.retro_colors["accent"], self.retro_colors["accent2"]]
-        for i, choice in enumerate(["rock", "paper", "scissors"]):
-            btn = self.create_retro_button(
-                buttons_frame,
-                text=f"> {choice.upper()}",
-                command=lambda c=choice, p=player_num: self.local_player_choice(c, p),
-                width=120,
-                height=40,
-                fg_color=choice_colors[i]
-            )
-            btn.grid(row=0, column=i, padx=10)
+        self._build_choice_buttons(buttons_frame, self.local_player_choice)
         
         # Warning message (don't let other player see)
-        warning = self.create_retro_label(
-            game_area,
+        self.create_retro_label(
+            view,
             text=">>> WARNING: OTHER PLAYER SHOULD NOT LOOK! <<<",
             font=self.retro_font,
             text_color=self.retro_colors["error"]
-        )
-        warning.grid(row=3, column=0, columnspan=3, pady=(20, 0))
-    
-    def local_player_choice(self, choice: str, player_num: int):
-        """Handle choice from a local player"""
-        self.play_sound("click")
-        
-        if player_num == 1:
-            self.local_player1_choice = Choice(choice)
-            # Show waiting message and then Player 2's input
-            self.show_local_player_waiting()
-        else:
-            self.local_player2_choice = Choice(choice)
-            # Both players have chosen, play the round
-            self.play_local_2player_round()
-    
-    def show_local_player_waiting(self):
-        """Show waiting screen between players"""
-        self.clear_frame()
+        ).grid(row=3, column=0, columnspan=3, pady=(20, 0))
         
-        waiting = self.create_retro_label(
-            self.current_frame,
+        # Hand-over view
+        view = widgets["waiting_view"]
+        self.create_retro_label(
+            view,
             text=">>> PLAYER 1'S CHOICE SAVED! <<<",
             font=self.retro_font_xlarge,
             text_color=self.retro_colors["accent"]
-        )
-        waiting.pack(pady=(50, 20))
+        ).grid(row=0, column=0, columnspan=3, pady=(50, 20))
         
-        instruction = self.create_retro_label(
-            self.current_frame,
+        self.create_retro_label(
+            view,
             text="> GIVE COMPUTER TO PLAYER 2 AND CLICK READY",
             font=self.retro_font_large
-        )
-        instruction.pack(pady=20)
+        ).grid(row=1, column=0, columnspan=3, pady=20)
         
-        # Get the game area frame to pass to show_local_player_input
-        game_area = ctk.CTkFrame(
-            self.current_frame,
-            fg_color=self.retro_colors["frame"],
-            border_color=self.retro_colors["border"],
-            border_width=2
-        )
-        game_area.pack(expand=True, fill="both", padx=20, pady=20)
-        game_area.grid_columnconfigure((0, 1, 2), weight=1)
-        game_area.grid_rowconfigure(1, weight=1)
-        
-        ready_btn = self.create_retro_button(
-            self.current_frame,
+        self.create_retro_button(
+            view,
             text="> READY - SHOW PLAYER 2 INPUT",
-            command=lambda: [self.play_sound("click"), self.show_local_player_input(2, game_area)],
+            command=partial(self._click_then, self.show_local_player_input, 2),
             font=self.retro_font_large,
             height=50
-        )
-        ready_btn.pack(pady=20, padx=100, fill="x")
-    
-    def play_local_2player_round(self):
-        """Play a round with two local players"""
-        result, message = self.game.play_round(self.local_player1_choice, self.local_player2_choice)
-        self.show_local_2player_result(result, message)
-    
-    def show_local_2player_result(self, result: GameResult, message: str):
-        """Show the result of a local 2-player round"""
-        self.clear_frame()
-        
-        # Update scores
-        self.current_frame.grid_columnconfigure(0, weight=1)
-        self.current_frame.grid_rowconfigure(1, weight=1)
-        
-        # Header with scores
-        header = ctk.CTkFrame(
-            self.current_frame,
-            height=60,
-            fg_color=self.retro_colors["frame"],
-            border_color=self.retro_colors["border"],
-            border_width=2
-        )
-        header.grid(row=0, column=0, sticky="ew", pady=(0, 20))
-        header.grid_columnconfigure((0, 1, 2), weight=1)
-        
-        # Player 1 info
-        player1_frame = ctk.CTkFrame(header, fg_color="transparent")
-        player1_frame.grid(row=0, column=0, sticky="w", padx=20)
-        
-        self.create_retro_label(
-            player1_frame,
-            text=f"> {self.game.player1_name.upper()}",
-            font=self.retro_font
-        ).pack()
-        
-        self.create_retro_label(
-            player1_frame,
-            text=f"SCORE: {self.game.player1_score}",
-            text_color=self.retro_colors["text_secondary"]
-        ).pack()
-        
-        # Round info
-        round_frame = ctk.CTkFrame(header, fg_color="transparent")
-        round_frame.grid(row=0, column=1)
-        
-        self.create_retro_label(
-            round_frame,
-            text=f">>> ROUND {self.game.round - 1} <<<",
-            font=self.retro_font_large,
-            text_color=self.retro_colors["accent"]
-        ).pack()
-        
-        # Player 2 info
-        player2_frame = ctk.CTkFrame(header, fg_color="transparent")
-        player2_frame.grid(row=0, column=2, sticky="e", padx=20)
-        
-        self.create_retro_label(
-            player2_frame,
-            text=f"{self.game.player2_name.upper()} <",
-            font=self.retro_font
-        ).pack()
-        
-        self.create_retro_label(
-            player2_frame,
-            text=f"SCORE: {self.game.player2_score}",
-            text_color=self.retro_colors["text_secondary"]
-        ).pack()
-        
-        # Result area
-        result_area = ctk.CTkFrame(
-            self.current_frame,
-            fg_color=self.retro_colors["frame"],
-            border_color=self.retro_colors["border"],
-            border_width=2
-        )
-        result_area.grid(row=1, column=0, sticky="nsew")
-        result_area.grid_columnconfigure((0, 1, 2), weight=1)
-        result_area.grid_rowconfigure(1, weight=1)
+        ).grid(row=2, column=0, columnspan=3, pady=20, padx=100, sticky="ew")
         
-        # Show choices
-        choices_frame = ctk.CTkFrame(result_area, fg_color="transparent")
+        # Result view: choices, result message and actions
+        view = widgets["result_view"]
+        choices_frame = ctk.CTkFrame(view, fg_color="transparent")
         choices_frame.grid(row=0, column=0, columnspan=3, pady=20)
         
-        self.create_retro_label(
+        widgets["p1_choice"] = self.create_retro_label(
             choices_frame,
-            text=f"{self.game.player1_name.upper()}: {self.game.player1_choice.value.upper()}",
+            text="",
             font=self.retro_font
-        ).pack(side="left", padx=40)
+        )
+        widgets["p1_choice"].pack(side="left", padx=40)
         
         self.create_retro_label(
             choices_frame,
@@ -833,57 +1132,119 @@ class GameUI(ctk.CTk):
             text_color=self.retro_colors["accent"]
         ).pack(side="left", padx=20)
         
-        self.create_retro_label(
+        widgets["p2_choice"] = self.create_retro_label(
             choices_frame,
-            text=f"{self.game.player2_choice.value.upper()}: {self.game.player2_name.upper()}",
+            text="",
             font=self.retro_font
-        ).pack(side="left", padx=40)
+        )
+        widgets["p2_choice"].pack(side="left", padx=40)
         
         # Result message
-        result_label = self.create_retro_label(
-            result_area,
-            text=f">>> {message.upper()} <<<",
+        widgets["message"] = self.create_retro_label(
+            view,
+            text="",
             font=self.retro_font_xlarge,
             text_color=self.retro_colors["accent"]
         )
-        result_label.grid(row=1, column=0, columnspan=3, pady=40)
-        
-        # Play sound
-        if result == GameResult.WIN:
-            self.play_sound("win")
-        elif result == GameResult.LOSE:
-            self.play_sound("lose")
-        else:
-            self.play_sound("draw")
+        widgets["message"].grid(row=1, column=0, columnspan=3, pady=40)
         
         # Action buttons
-        button_frame = ctk.CTkFrame(self.current_frame, fg_color="transparent")
-        button_frame.grid(row=2, column=0, pady=(20, 0))
+        button_frame = ctk.CTkFrame(view, fg_color="transparent")
+        button_frame.grid(row=2, column=0, columnspan=3, pady=(0, 20))
         
-        next_btn = self.create_retro_button(
+        self.create_retro_button(
             button_frame,
             text="> NEXT ROUND",
-            command=lambda: [self.play_sound("click"), self.show_local_2player_game_screen()],
+            command=partial(self._click_then, self.start_local_2player_round),
             width=120,
             height=40
-        )
-        next_btn.pack(side="left", padx=10)
+        ).pack(side="left", padx=10)
         
-        menu_btn = self.create_retro_button(
+        self.create_retro_button(
             button_frame,
             text="> MAIN MENU",
-            command=lambda: [self.play_sound("click"), self.show_main_menu()],
+            command=partial(self._click_then, self.show_main_menu),
             width=120,
             height=40
-        )
-        menu_btn.pack(side="left", padx=10)
+        ).pack(side="left", padx=10)
+        
+        widgets["shown"] = None  # name of the view currently gridded
+        return widgets
+    
+    def _show_local_view(self, name: str):
+        """Swap the local game area to one of its prebuilt views"""
+        widgets = self._live_widgets
+        if widgets["shown"] is not None:
+            widgets[f"{widgets['shown']}_view"].grid_remove()
+        widgets[f"{name}_view"].grid()
+        widgets["shown"] = name
+    
+    def start_local_2player_round(self):
+        """Reset the local choices and show Player 1's input"""
+        self._update_score_vars()
+        
+        # Initialize local 2-player state
+        self.local_player1_choice = None
+        self.local_player2_choice = None
+        
+        # Show Player 1's input screen
+        self.show_local_player_input(1)
+    
+    def show_local_player_input(self, player_num: int):
+        """Show input screen for a local player"""
+        player_name = self._names_upper[player_num - 1]
+        self._live_widgets["turn_title"].configure(text=f">>> {player_name}'S TURN <<<")
+        self._show_local_view("input")
+    
+    def local_player_choice(self, choice: Choice):
+        """Handle choice from the local player on turn"""
+        self.play_sound("click")
+        
+        if self.local_player1_choice is None:
+            self.local_player1_choice = choice
+            # Show waiting message and then Player 2's input
+            self.show_local_player_waiting()
+        else:
+            self.local_player2_choice = choice
+            # Both players have chosen, play the round
+            self.play_local_2player_round()
+    
+    def show_local_player_waiting(self):
+        """Show the hand-over message between players"""
+        self._show_local_view("waiting")
+    
+    def play_local_2player_round(self):
+        """Play a round with two local players"""
+        result, message = self.game.play_round(self.local_player1_choice, self.local_player2_choice)
+        self.show_local_2player_result(result, message)
+    
+    def show_local_2player_result(self, result: GameResult, message: str):
+        """Show the result of a local 2-player round inside the game area"""
+        # Header labels update in place through their StringVars
+        self._update_score_vars(self.game.round - 1)
+        
+        widgets = self._live_widgets
+        widgets["p1_choice"].configure(
+            text=f"{self._names_upper[0]}: {_CHOICE_UPPER[self.game.player1_choice]}")
+        widgets["p2_choice"].configure(
+            text=f"{_CHOICE_UPPER[self.game.player2_choice]}: {self._names_upper[1]}")
+        widgets["message"].configure(text=f">>> {message.upper()} <<<")
+        self._show_local_view("result")
+        
+        # Play sound (the result values double as sound names)
+        self.play_sound(result.value)
     
     def show_waiting_for_opponent(self, room_code: str):
         """Show waiting screen for opponent to join"""
-        self.clear_frame()
-        
+        self._waiting_room_code = room_code
+        self._show_screen("waiting_for_opponent", self._build_waiting_for_opponent)
+        # Only the room code changes between visits
+        self._room_code_label.configure(text=f">>> {room_code} <<<")
+    
+    def _build_waiting_for_opponent(self, frame):
+        """Build the waiting screen widgets (once)"""
         title = self.create_retro_label(
-            self.current_frame,
+            frame,
             text=">>> WAITING FOR OPPONENT <<<",
             font=self.retro_font_xlarge,
             text_color=self.retro_colors["accent"]
@@ -891,35 +1252,35 @@ class GameUI(ctk.CTk):
         title.pack(pady=(50, 30))
         
         info_label = self.create_retro_label(
-            self.current_frame,
+            frame,
             text="> SHARE THIS ROOM CODE WITH YOUR OPPONENT:",
             font=self.retro_font
         )
         info_label.pack(pady=(0, 10))
         
         # Room code display with copy button
-        code_frame = ctk.CTkFrame(self.current_frame, fg_color="transparent")
+        code_frame = ctk.CTkFrame(frame, fg_color="transparent")
         code_frame.pack(pady=20)
         
-        code_label = self.create_retro_label(
+        self._room_code_label = self.create_retro_label(
             code_frame,
-            text=f">>> {room_code} <<<",
+            text="",
             font=self.retro_font_large,
             text_color=self.retro_colors["accent"]
         )
-        code_label.pack(side="left", padx=(0, 10))
+        self._room_code_label.pack(side="left", padx=(0, 10))
         
         copy_btn = self.create_retro_button(
             code_frame,
             text="> COPY",
-            command=lambda: self.copy_to_clipboard(room_code),
+            command=lambda: self.copy_to_clipboard(self._waiting_room_code),
             width=80
         )
         copy_btn.pack(side="left")
         
         # Waiting indicator
         waiting_label = self.create_retro_label(
-            self.current_frame,
+            frame,
             text=">>> WAITING... <<<",
             font=self.retro_font_large,
             text_color=self.retro_colors["text_secondary"]
@@ -928,7 +1289,7 @@ class GameUI(ctk.CTk):
         
         # Cancel button
         cancel_btn = self.create_retro_button(
-            self.current_frame,
+            frame,
             text="> CANCEL",
             command=self.cancel_online_game,
             height=40,
@@ -939,243 +1300,135 @@ class GameUI(ctk.CTk):
     
     def copy_to_clipboard(self, text: str):
         """Copy text to clipboard"""
+        self.play_sound("click")
+        # Claim the clipboard after the click handler returns so the press feels instant
+        self.after_idle(self._set_clipboard, text)
+    
+    def _set_clipboard(self, text: str):
         self.clipboard_clear()
         self.clipboard_append(text)
-        self.play_sound("click")
     
     def show_online_game_screen(self):
-        """Show the online game screen"""
-        self.clear_frame()
-        
-        # Configure grid
-        self.current_frame.grid_columnconfigure(0, weight=1)
-        self.current_frame.grid_rowconfigure(1, weight=1)
-        
-        # Header with scores
-        header = ctk.CTkFrame(
-            self.current_frame,
-            height=60,
-            fg_color=self.retro_colors["frame"],
-            border_color=self.retro_colors["border"],
-            border_width=2
-        )
-        header.grid(row=0, column=0, sticky="ew", pady=(0, 20))
-        header.grid_columnconfigure((0, 1, 2), weight=1)
-        
-        # Player 1 info
-        player1_frame = ctk.CTkFrame(header, fg_color="transparent")
-        player1_frame.grid(row=0, column=0, sticky="w", padx=20)
-        
-        self.create_retro_label(
-            player1_frame,
-            text=f"> {self.game.player1_name.upper()}",
-            font=self.retro_font
-        ).pack()
-        
-        self.player1_score_label = self.create_retro_label(
-            player1_frame,
-            text=f"SCORE: {self.game.player1_score}",
-            text_color=self.retro_colors["text_secondary"]
-        )
-        self.player1_score_label.pack()
-        
-        # Round info
-        round_frame = ctk.CTkFrame(header, fg_color="transparent")
-        round_frame.grid(row=0, column=1)
-        
-        self.round_label = self.create_retro_label(
-            round_frame,
-            text=f">>> ROUND {self.game.round} <<<",
-            font=self.retro_font_large,
-            text_color=self.retro_colors["accent"]
-        )
-        self.round_label.pack()
-        
-        # Player 2 info
-        player2_frame = ctk.CTkFrame(header, fg_color="transparent")
-        player2_frame.grid(row=0, column=2, sticky="e", padx=20)
-        
-        self.create_retro_label(
-            player2_frame,
-            text=f"{self.game.player2_name.upper()} <",
-            font=self.retro_font
-        ).pack()
-        
-        self.player2_score_label = self.create_retro_label(
-            player2_frame,
-            text=f"SCORE: {self.game.player2_score}",
-            text_color=self.retro_colors["text_secondary"]
-        )
-        self.player2_score_label.pack()
-        
-        # Game area
-        game_area = ctk.CTkFrame(
-            self.current_frame,
-            fg_color=self.retro_colors["frame"],
-            border_color=self.retro_colors["border"],
-            border_width=2
-        )
-        game_area.grid(row=1, column=0, sticky="nsew")
-        game_area.grid_columnconfigure((0, 1, 2), weight=1)
-        game_area.grid_rowconfigure(1, weight=1)
-        
-        # Player choices
-        choices_frame = ctk.CTkFrame(game_area, fg_color="transparent")
-        choices_frame.grid(row=0, column=0, columnspan=3, pady=(0, 20))
-        
-        self.create_retro_label(
-            choices_frame,
-            text="> CHOOSE YOUR MOVE:",
-            font=self.retro_font_large
-        ).pack()
-        
-        # Choice buttons
-        buttons_frame = ctk.CTkFrame(choices_frame, fg_color="transparent")
-        buttons_frame.pack(pady=10)
-        
-        choice_colors = [self.retro_colors["button"], self.retro_colors["accent"], self.retro_colors["accent2"]]
-        for i, choice in enumerate(["rock", "paper", "scissors"]):
-            btn = self.create_retro_button(
-                buttons_frame,
-                text=f"> {choice.upper()}",
-                command=lambda c=choice: self.make_online_choice(Choice(c)),
-                width=120,
-                height=40,
-                fg_color=choice_colors[i]
-            )
-            btn.grid(row=0, column=i, padx=10)
-        
-        # Result display
-        self.result_frame = ctk.CTkFrame(game_area, fg_color="transparent")
-        self.result_frame.grid(row=1, column=0, columnspan=3, sticky="nsew")
-        
-        # Status label
-        status_label = self.create_retro_label(
-            self.result_frame,
-            text="> WAITING FOR OPPONENT'S CHOICE...",
-            font=self.retro_font
-        )
-        status_label.pack(pady=20)
+        """Show the online game screen, ready for the next round"""
+        self._show_screen("online_game", self._build_online_game_screen)
+        self._update_name_vars()
+        self.start_online_round()
+    
+    def start_online_round(self):
+        """Reset the cached online screen in place for the next round"""
+        self._update_score_vars()
+        self.update_online_status("Waiting for opponent's choice...")
+    
+    def _build_online_game_screen(self, frame) -> Dict[str, Any]:
+        """Build the online game screen once; rounds only reconfigure its widgets"""
+        # Result display: the result widgets are built now and shown per round
+        result_frame = self._build_choice_area(frame, self.make_online_choice)
+        return {
+            "result_frame": result_frame,
+            "status": self.create_retro_label(
+                result_frame,
+                text="",
+                font=self.retro_font
+            ),
+            "choices": self.create_retro_label(
+                result_frame,
+                text="",
+                font=self.retro_font
+            ),
+            "result": self.create_retro_label(
+                result_frame,
+                text="",
+                font=self.retro_font_large,
+                text_color=self.retro_colors["accent"]
+            ),
+            "next_round": self.create_retro_button(
+                result_frame,
+                text="> NEXT ROUND",
+                command=partial(self._click_then, self.start_online_round)
+            ),
+        }
     
     def make_online_choice(self, choice: Choice):
         """Send choice to opponent"""
+        if self._awaiting_opponent:
+            return  # this round's choice is already sent; a second one would count for the next round
         self.play_sound("click")
         
         # Send choice to opponent
         if self.network_manager:
             self.network_manager.send_player_choice(choice.value)
         
-        # Store our choice and wait for opponent
+        # Store our choice and wait for opponent (their choice may already be here)
         self.game.player1_choice = choice
-        self.opponent_choice = None
-        self.opponent_ready = False
+        self._awaiting_opponent = True
         
         # Show waiting status
         self.update_online_status("Choice sent! Waiting for opponent...")
         
-        # Check periodically if opponent has responded
-        self.check_opponent_response()
+        # _handle_opponent_choice plays the round when their choice is drained
+        if self._opponent_timeout_id is not None:
+            self.after_cancel(self._opponent_timeout_id)
+        self._opponent_timeout_id = self.after(OPPONENT_TIMEOUT_MS, self._opponent_timed_out)
+        self._on_opponent_ready()
     
     def update_online_status(self, message: str):
         """Update status message in result frame"""
-        for widget in self.result_frame.winfo_children():
-            widget.destroy()
+        status = self._live_widgets.get("status")
+        if status is None:
+            return  # online game screen is not on display
+        for widget in self._live_widgets["result_frame"].winfo_children():
+            widget.pack_forget()
         
-        status = self.create_retro_label(
-            self.result_frame,
-            text=f"> {message.upper()}",
-            font=self.retro_font
-        )
+        status.configure(text=f"> {message.upper()}")
         status.pack(pady=20)
     
-    def check_opponent_response(self, attempts: int = 0):
-        """Check if opponent has made their choice"""
-        if attempts > 30:  # 30 seconds timeout
+    def _on_opponent_ready(self):
+        """Play the round as soon as both choices are in (runs on the Tk thread)"""
+        if not self._awaiting_opponent or self.opponent_choice is None:
+            return  # choice arrived first; make_online_choice picks it up
+        self._awaiting_opponent = False
+        if self._opponent_timeout_id is not None:
+            self.after_cancel(self._opponent_timeout_id)
+            self._opponent_timeout_id = None
+        
+        # Both players have chosen, play the round
+        self.game.player2_choice = self.opponent_choice
+        self.opponent_choice = None
+        self.opponent_ready = False
+        result, message = self.game.play_round(self.game.player1_choice, self.game.player2_choice)
+        self.update_online_game_ui(result, message)
+    
+    def _opponent_timed_out(self):
+        """Give up on an opponent that never answered"""
+        self._opponent_timeout_id = None
+        if self._awaiting_opponent:
+            self._end_online_game()
             self._show_error("Opponent did not respond. Connection may have been lost.")
             self.show_main_menu()
-            return
-        
-        if self.opponent_choice:
-            # Both players have chosen, play the round
-            self.game.player2_choice = self.opponent_choice
-            result, message = self.game.play_round(self.game.player1_choice, self.game.player2_choice)
-            self.update_online_game_ui(result, message)
-        else:
-            # Check again after 1 second
-            self.after(1000, lambda: self.check_opponent_response(attempts + 1))
     
     def update_online_game_ui(self, result: GameResult, message: str):
         """Update the online game UI with result"""
-        # Update scores safely
-        try:
-            if hasattr(self, 'player1_score_label') and self.player1_score_label.winfo_exists():
-                self.player1_score_label.configure(text=f"SCORE: {self.game.player1_score}")
-        except Exception:
-            pass
-
-        try:
-            if hasattr(self, 'player2_score_label') and self.player2_score_label.winfo_exists():
-                self.player2_score_label.configure(text=f"SCORE: {self.game.player2_score}")
-        except Exception:
-            pass
-
-        try:
-            if hasattr(self, 'round_label') and self.round_label.winfo_exists():
-                self.round_label.configure(text=f"Round {self.game.round}")
-        except Exception:
-            pass
-
-        # Clear previous result and show new info
-        try:
-            if hasattr(self, 'result_frame') and self.result_frame.winfo_exists():
-                for widget in self.result_frame.winfo_children():
-                    widget.destroy()
-
-                # Show choices
-                choices_text = f"YOUR MOVE: {self.game.player1_choice.value.upper()} | OPPONENT: {self.game.player2_choice.value.upper()}"
-                choices_label = self.create_retro_label(
-                    self.result_frame,
-                    text=f"> {choices_text}",
-                    font=self.retro_font
-                )
-                choices_label.pack(pady=10)
-
-                # Show result
-                result_label = self.create_retro_label(
-                    self.result_frame,
-                    text=f">>> {message.upper()} <<<",
-                    font=self.retro_font_large,
-                    text_color=self.retro_colors["accent"]
-                )
-                result_label.pack(pady=10)
-
-                # Next round button
-                next_btn = self.create_retro_button(
-                    self.result_frame,
-                    text="> NEXT ROUND",
-                    command=lambda: [self.play_sound("click"), self.show_online_game_screen()]
-                )
-                next_btn.pack(pady=10)
-        except Exception:
-            pass
+        choices_text = f"YOUR MOVE: {_CHOICE_UPPER[self.game.player1_choice]} | OPPONENT: {_CHOICE_UPPER[self.game.player2_choice]}"
+        self._queue_ui_update(scores=True, message=message, choices=choices_text)
 
         # Play appropriate sound
-        try:
-            if result == GameResult.WIN:
-                self.play_sound("win")
-            elif result == GameResult.LOSE:
-                self.play_sound("lose")
-            else:
-                self.play_sound("draw")
-        except Exception:
-            pass
+        self.play_sound(result.value)
     
     def cancel_online_game(self):
         """Cancel online game and return to main menu"""
         self.play_sound("click")
+        self._end_online_game()
+        self.show_main_menu()
+    
+    def _end_online_game(self):
+        """Stop waiting on the opponent and close the connection"""
+        self._awaiting_opponent = False
+        if self._opponent_timeout_id is not None:
+            self.after_cancel(self._opponent_timeout_id)
+            self._opponent_timeout_id = None
+        self._stop_network_events()
         if self.network_manager:
             self.network_manager.disconnect()
-        self.show_main_menu()
     
     def start_game(self, mode: GameMode):
         """Start a new game with the specified mode"""
@@ -1192,112 +1445,26 @@ class GameUI(ctk.CTk):
     
     def show_game_screen(self):
         """Show the main game screen"""
-        self.clear_frame()
-        
-        # Configure grid
-        self.current_frame.grid_columnconfigure(0, weight=1)
-        self.current_frame.grid_rowconfigure(1, weight=1)
+        self._show_screen("game", self._build_game_screen)
+        self._reset_game_screen()
         
-        # Header with scores
-        header = ctk.CTkFrame(
-            self.current_frame,
-            height=60,
-            fg_color=self.retro_colors["frame"],
-            border_color=self.retro_colors["border"],
-            border_width=2
-        )
-        header.grid(row=0, column=0, sticky="ew", pady=(0, 20))
-        header.grid_columnconfigure((0, 1, 2), weight=1)
-        
-        # Player 1 info
-        player1_frame = ctk.CTkFrame(header, fg_color="transparent")
-        player1_frame.grid(row=0, column=0, sticky="w", padx=20)
-        
-        self.create_retro_label(
-            player1_frame,
-            text=f"> {self.game.player1_name.upper()}",
-            font=self.retro_font
-        ).pack()
-        
-        self.player1_score_label = self.create_retro_label(
-            player1_frame,
-            text=f"SCORE: {self.game.player1_score}",
-            text_color=self.retro_colors["text_secondary"]
-        )
-        self.player1_score_label.pack()
-        
-        # Round info
-        round_frame = ctk.CTkFrame(header, fg_color="transparent")
-        round_frame.grid(row=0, column=1)
-        
-        self.round_label = self.create_retro_label(
-            round_frame,
-            text=f">>> ROUND {self.game.round} <<<",
+        # If in AI vs AI mode, start auto-playing
+        if self.game.game_mode == GameMode.AI_VS_AI:
+            self._ai_round_id = self.after(AI_FIRST_ROUND_MS, self.ai_vs_ai_round)
+    
+    def _build_game_screen(self, frame) -> Dict[str, Any]:
+        """Build the game screen once; new games and rounds only reconfigure it"""
+        # Result display: one label, reconfigured every round
+        result_frame = self._build_choice_area(frame, self.make_choice)
+        result_label = self.create_retro_label(
+            result_frame,
+            text="",
             font=self.retro_font_large,
             text_color=self.retro_colors["accent"]
         )
-        self.round_label.pack()
-        
-        # Player 2 info
-        player2_frame = ctk.CTkFrame(header, fg_color="transparent")
-        player2_frame.grid(row=0, column=2, sticky="e", padx=20)
-        
-        self.create_retro_label(
-            player2_frame,
-            text=f"{self.game.player2_name.upper()} <",
-            font=self.retro_font
-        ).pack()
-        
-        self.player2_score_label = self.create_retro_label(
-            player2_frame,
-            text=f"SCORE: {self.game.player2_score}",
-            text_color=self.retro_colors["text_secondary"]
-        )
-        self.player2_score_label.pack()
-        
-        # Game area
-        game_area = ctk.CTkFrame(
-            self.current_frame,
-            fg_color=self.retro_colors["frame"],
-            border_color=self.retro_colors["border"],
-            border_width=2
-        )
-        game_area.grid(row=1, column=0, sticky="nsew")
-        game_area.grid_columnconfigure((0, 1, 2), weight=1)
-        game_area.grid_rowconfigure(1, weight=1)
-        
-        # Player choices
-        choices_frame = ctk.CTkFrame(game_area, fg_color="transparent")
-        choices_frame.grid(row=0, column=0, columnspan=3, pady=(0, 20))
-        
-        self.create_retro_label(
-            choices_frame,
-            text="> CHOOSE YOUR MOVE:",
-            font=self.retro_font_large
-        ).pack()
-        
-        # Choice buttons
-        buttons_frame = ctk.CTkFrame(choices_frame, fg_color="transparent")
-        buttons_frame.pack(pady=10)
-        
-        choice_colors = [self.retro_colors["button"], self.retro_colors["accent"], self.retro_colors["accent2"]]
-        for i, choice in enumerate(["rock", "paper", "scissors"]):
-            btn = self.create_retro_button(
-                buttons_frame,
-                text=f"> {choice.upper()}",
-                command=lambda c=choice: self.make_choice(Choice(c)),
-                width=120,
-                height=40,
-                fg_color=choice_colors[i]
-            )
-            btn.grid(row=0, column=i, padx=10)
-        
-        # Result display
-        self.result_frame = ctk.CTkFrame(game_area, fg_color="transparent")
-        self.result_frame.grid(row=1, column=0, columnspan=3, sticky="nsew")
         
         # Action buttons
-        buttons_frame = ctk.CTkFrame(self.current_frame, fg_color="transparent")
+        buttons_frame = ctk.CTkFrame(frame, fg_color="transparent")
         buttons_frame.grid(row=2, column=0, pady=(20, 0))
         
         restart_btn = self.create_retro_button(
@@ -1312,15 +1479,20 @@ class GameUI(ctk.CTk):
         menu_btn = self.create_retro_button(
             buttons_frame,
             text="> MAIN MENU",
-            command=lambda: [self.play_sound("click"), self.show_main_menu()],
+            command=partial(self._click_then, self.show_main_menu),
             width=120,
             height=40
         )
         menu_btn.pack(side="left", padx=10)
         
-        # If in AI vs AI mode, start auto-playing
-        if self.game.game_mode == GameMode.AI_VS_AI:
-            self.after(1000, self.ai_vs_ai_round)
+        return {"result_frame": result_frame, "result": result_label}
+    
+    def _reset_game_screen(self):
+        """Show the current names and scores and hide the last round's result"""
+        self._pending_ui_update.clear()  # drop results queued for the previous game
+        self._update_name_vars()
+        self._update_score_vars()
+        self._live_widgets["result"].pack_forget()
     
     def make_choice(self, choice: Choice):
         """Handle player's choice"""
@@ -1335,92 +1507,29 @@ class GameUI(ctk.CTk):
     
     def ai_vs_ai_round(self):
         """Handle AI vs AI game mode"""
+        self._ai_round_id = None
         if self.game.game_mode == GameMode.AI_VS_AI:
             result, message = self.game.play_round()
             self.update_game_ui(result, message)
             
             # Schedule next round
-            self.after(2000, self.ai_vs_ai_round)
+            self._ai_round_id = self.after(AI_ROUND_DELAY_MS, self.ai_vs_ai_round)
+    
+    def _stop_ai_rounds(self):
+        """Cancel the pending AI vs AI round, if any"""
+        if self._ai_round_id is not None:
+            self.after_cancel(self._ai_round_id)
+            self._ai_round_id = None
     
     def update_game_ui(self, result: GameResult, message: str):
         """Update the game UI with the latest result"""
-        # Update scores safely (widgets may have been destroyed)
-        try:
-            if hasattr(self, 'player1_score_label') and self.player1_score_label.winfo_exists():
-                self.player1_score_label.configure(text=f"SCORE: {self.game.player1_score}")
-        except Exception:
-            pass
-
-        try:
-            if hasattr(self, 'player2_score_label') and self.player2_score_label.winfo_exists():
-                self.player2_score_label.configure(text=f"SCORE: {self.game.player2_score}")
-        except Exception:
-            pass
-
-        try:
-            if hasattr(self, 'round_label') and self.round_label.winfo_exists():
-                self.round_label.configure(text=f"Round {self.game.round}")
-        except Exception:
-            pass
-
-        # Clear previous result and show new result if result_frame exists
-        try:
-            if hasattr(self, 'result_frame') and self.result_frame.winfo_exists():
-                for widget in self.result_frame.winfo_children():
-                    widget.destroy()
-
-                result_label = self.create_retro_label(
-                    self.result_frame,
-                    text=f">>> {message.upper()} <<<",
-                    font=self.retro_font_large,
-                    text_color=self.retro_colors["accent"]
-                )
-                result_label.pack(pady=20)
-        except Exception:
-            pass
+        self._queue_ui_update(scores=True, message=message)
 
         # Play appropriate sound
-        try:
-            if result == GameResult.WIN:
-                self.play_sound("win")
-            elif result == GameResult.LOSE:
-                self.play_sound("lose")
-            else:
-                self.play_sound("draw")
-        except Exception:
-            pass
+        self.play_sound(result.value)
     
     def restart_game(self):
         """Restart the current game"""
         self.play_sound("click")
         self.game.reset_game()
-        self.show_game_screen()
-# ... trong hàm draw_menu() ...
-
-        # ==================== MATCH HISTORY SIÊU ĐẸP ====================
-        try:
-            from save_load import load_history
-            history = load_history()[:8]
-            
-            hist_title = ctk.CTkLabel(self.current_frame, text=">>> MATCH HISTORY <<<", 
-                                     font=("Courier New", 24, "bold"), text_color="#00ff41")
-            hist_title.pack(pady=(40, 10))
-
-            if history:
-                for entry in history:
-                    if "Win vs AI" in entry["desc"] or "Win" in entry["desc"]:
-                        color = "#00ff41"   # xanh lá = thắng
-                    elif "AI Win" in entry["desc"]:
-                        color = "#ff3333"   # đỏ = thua
-                    else:
-                        color = "#ffff00"   # vàng = hòa
-                    txt = f"• {entry['desc']:35} {entry['time']}"
-                    ctk.CTkLabel(self.current_frame, text=txt, font=("Courier New", 16), 
-                                text_color=color).pack()
-            else:
-                ctk.CTkLabel(self.current_frame, text="> No matches yet <", 
-                            font=self.retro_font, text_color="#666666").pack(pady=10)
-        except:
-            ctk.CTkLabel(self.current_frame, text="> No matches yet <", 
-                        font=self.retro_font, text_color="#666666").pack(pady=10)
-        # ================================================================
\ No newline at end of file
+        self._reset_game_screen()
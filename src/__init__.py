@@ -1 +0,0 @@
-# This file makes Python treat the directory as a package